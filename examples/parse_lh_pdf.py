@@ -330,10 +330,13 @@ def debug_parse_lh_announcement(
     if all_tables:
         print(f"\n  Table quality metrics:")
         for i, table in enumerate(all_tables, 1):
+            # quality_score is None when accuracy alone guaranteed a pass
+            quality_score = table.metadata.get("quality_score")
+            quality = "n/a" if quality_score is None else f"{quality_score:.2f}"
             print(
                 f"    Table {i} (page {table.page}): "
                 f"accuracy={table.metadata.get('accuracy', 0):.1f}%, "
-                f"quality={table.metadata.get('quality_score', 0):.2f}, "
+                f"quality={quality}, "
                 f"shape={table.dataframe.shape}, "
                 f"flavor={table.metadata.get('flavor', 'unknown')}"
             )
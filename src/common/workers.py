@@ -0,0 +1,43 @@
+"""Process pool helpers shared by the parsers."""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from multiprocessing.context import BaseContext
+from typing import Optional
+
+# Modules the forkserver imports once up front, so each worker does not pay
+# for importing them (and Camelot, pdfplumber, PyMuPDF) again
+_PRELOAD = ["src.parsers.table_extractor", "src.parsers.hierarchy_parser"]
+
+_context: Optional[BaseContext] = None
+_context_lock = threading.Lock()
+
+
+def worker_context() -> BaseContext:
+    """
+    Return a multiprocessing context that is safe to use from threaded code.
+
+    ``LHPDFParser.parse`` runs pipeline stages on threads, and plain ``fork``
+    from a multi-threaded parent can copy locks held by another thread
+    (e.g. inside PyMuPDF) into the children. Workers are therefore started
+    from a forkserver where available, falling back to ``spawn``.
+
+    The forkserver preload is process-wide, so it is configured on the
+    first call (when the parsers first need a pool) rather than on import,
+    and left alone afterwards.
+
+    Returns:
+        Multiprocessing context for ``ProcessPoolExecutor(mp_context=...)``
+    """
+    global _context
+
+    with _context_lock:
+        if _context is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload(_PRELOAD)
+            else:
+                context = multiprocessing.get_context("spawn")
+            _context = context
+        return _context
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -157,7 +158,8 @@ class LHAnnouncementCrawler:
             metadata: Dict[str, str] = {}
             cells = row.find_all("td")
             for index, cell in enumerate(cells):
-                key = f"col_{index}"
+                # Every row repeats the same keys; share one string per column
+                key = sys.intern(f"col_{index}")
                 metadata[key] = cell.get_text(strip=True)
 
             announcements.append(
@@ -20,9 +20,9 @@ class ElementType(Enum):
     EMPHASIZED = "emphasized"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
-    """Bounding box coordinates for document elements."""
+    """Bounding box coordinates for document elements (immutable)."""
 
     x0: float
     y0: float
@@ -40,6 +40,16 @@ class BoundingBox:
         """Calculate height of bounding box."""
         return self.y1 - self.y0
 
+    @property
+    def area(self) -> float:
+        """Calculate area of bounding box."""
+        return (self.x1 - self.x0) * (self.y1 - self.y0)
+
+    @property
+    def camelot_area(self) -> str:
+        """Format as a Camelot table area: left,top,right,bottom in PDF space."""
+        return f"{self.x0},{self.y1},{self.x1},{self.y0}"
+
     def overlaps(self, other: BoundingBox) -> bool:
         """Check if this bbox overlaps with another."""
         if self.page != other.page:
@@ -53,7 +63,7 @@ class BoundingBox:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """A block of text with positioning information."""
 
@@ -75,7 +85,7 @@ class TextBlock:
         return self.bbox.y0
 
 
-@dataclass
+@dataclass(slots=True)
 class TableData:
     """Structured table data."""
 
@@ -103,7 +113,7 @@ class TableData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A hierarchical section of the document."""
 
@@ -140,6 +150,15 @@ class Section:
         return f"{indent}{self.level}. {self.title} ({len(self.children)} subsections, {len(self.tables)} tables)"
 
 
+@dataclass(slots=True)
+class PageResult:
+    """Text and tables parsed from a single page."""
+
+    page: int
+    text_blocks: List[TextBlock] = field(default_factory=list)
+    tables: List[TableData] = field(default_factory=list)
+
+
 @dataclass
 class Document:
     """Complete parsed document structure."""
@@ -153,36 +172,28 @@ class Document:
         self.sections.append(section)
 
     def get_all_tables(self) -> List[TableData]:
-        """Get all tables from all sections recursively."""
+        """Get all tables from all sections, in document (pre-)order."""
         tables = []
 
-        def collect_tables(section: Section) -> None:
+        # Explicit stack instead of recursion; children pushed in reverse
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
             tables.extend(section.tables)
-            for child in section.children:
-                collect_tables(child)
-
-        for section in self.sections:
-            collect_tables(section)
+            stack.extend(reversed(section.children))
 
         return tables
 
     def find_section(self, title_pattern: str) -> Optional[Section]:
-        """Find a section by title pattern (case-insensitive)."""
+        """Find the first section by title pattern (case-insensitive)."""
         title_lower = title_pattern.lower()
 
-        def search(section: Section) -> Optional[Section]:
+        stack = list(reversed(self.sections))
+        while stack:
+            section = stack.pop()
             if title_lower in section.title.lower():
                 return section
-            for child in section.children:
-                result = search(child)
-                if result:
-                    return result
-            return None
-
-        for section in self.sections:
-            result = search(section)
-            if result:
-                return result
+            stack.extend(reversed(section.children))
 
         return None
 
@@ -2,30 +2,49 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import pdfplumber
 
+from src.common.workers import worker_context
 from src.models.document_structure import BoundingBox, Section, TextBlock
 
 LOGGER = logging.getLogger(__name__)
 
+# Numbered headings in one pass: "1. Title", "3-1. Subtitle" or "가. Title"
+_NUMBERED_HEADING_RE = re.compile(
+    r"^(?:(?P<number>\d+)\.\s+(?P<title>.+)"
+    r"|(?P<major>\d+)-(?P<minor>\d+)\.\s+(?P<sub_title>.+)"
+    r"|(?P<letter>[가-힣])\.\s+(?P<letter_title>.+))$"
+)
+
+# Parenthesized metadata under a document title, e.g. "(입주자모집공고일 : 2025.09.29)"
+_SUBTITLE_RE = re.compile(r"^\([^)]{5,80}\)$")
+
 
 class HierarchyParser:
     """Parses hierarchical document structure from PDF text."""
 
-    def __init__(self) -> None:
-        """Initialize hierarchy parser."""
-        # Patterns for detecting section headings
-        self.heading_patterns = [
-            re.compile(r"^(\d+)\.\s+(.+)$"),  # "1. Title"
-            re.compile(r"^(\d+-\d+)\.\s+(.+)$"),  # "3-1. Subtitle"
-            re.compile(r"^([가-힣])\.\s+(.+)$"),  # "가. Title"
-            re.compile(r"^■\s+(.+)$"),  # "■ Title"
-            re.compile(r"^▶\s+(.+)$"),  # "▶ Title"
-        ]
+    def __init__(
+        self, max_workers: Optional[int] = None, pages_per_chunk: int = 20
+    ) -> None:
+        """
+        Initialize hierarchy parser.
+
+        Args:
+            max_workers: Worker processes for text extraction on documents
+                longer than one chunk (defaults to the CPU count, capped at
+                8; 1 disables the process pool)
+            pages_per_chunk: Pages handed to each worker process
+        """
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self.pages_per_chunk = pages_per_chunk
 
         # Threshold for detecting indentation levels
         self.indent_threshold = 20  # pixels
@@ -35,6 +54,7 @@ class HierarchyParser:
         self,
         pdf_path: Path,
         exclude_regions: Optional[List[BoundingBox]] = None,
+        text_blocks: Optional[List[TextBlock]] = None,
     ) -> List[Section]:
         """
         Parse hierarchical structure from PDF.
@@ -42,28 +62,111 @@ class HierarchyParser:
         Args:
             pdf_path: Path to PDF file
             exclude_regions: Bounding boxes to exclude (e.g., tables)
+            text_blocks: Text blocks already produced by extract_text_blocks
+                for this PDF; extracted here if None
 
         Returns:
             List of top-level sections
         """
+        if text_blocks is None:
+            text_blocks = self.extract_text_blocks(pdf_path)
+
+        # IMPORTANT: Filter carefully - preserve headings even in table regions
+        if exclude_regions:
+            text_blocks = self.filter_table_regions(
+                text_blocks, exclude_regions
+            )
+
+        # Build hierarchical structure
+        sections = self.build_hierarchy(text_blocks)
+
+        return sections
+
+    def extract_text_blocks(self, pdf_path: Path) -> List[TextBlock]:
+        """
+        Extract line-level text blocks from every page, in page order.
+
+        Pages are independent, so documents longer than ``pages_per_chunk``
+        are extracted in page chunks across worker processes.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            List of TextBlock objects
+        """
         with pdfplumber.open(pdf_path) as pdf:
-            all_text_blocks = []
+            page_count = len(pdf.pages)
 
-            for page_num, page in enumerate(pdf.pages):
-                text_blocks = self._extract_text_blocks(page, page_num)
+        size = self.pages_per_chunk
+        chunks = [
+            (pdf_path, start, min(start + size, page_count))
+            for start in range(0, page_count, size)
+        ]
 
-                # IMPORTANT: Filter carefully - preserve headings even in table regions
-                if exclude_regions:
-                    text_blocks = self._filter_excluded_regions_smart(
-                        text_blocks, exclude_regions
-                    )
+        results = None
+        if len(chunks) > 1 and self.max_workers > 1:
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(chunks)),
+                    mp_context=worker_context(),
+                ) as executor:
+                    futures = [
+                        executor.submit(self._extract_page_range, *chunk)
+                        for chunk in chunks
+                    ]
+                    results = [future.result() for future in futures]
+            except BrokenProcessPool as exc:
+                LOGGER.warning(f"Worker pool failed, extracting in-process: {exc}")
+
+        if results is None:
+            results = [self._extract_page_range(*chunk) for chunk in chunks]
+
+        return [block for chunk_blocks in results for block in chunk_blocks]
+
+    def iter_text_blocks(
+        self, pdf_path: Path
+    ) -> Iterator[Tuple[int, List[TextBlock]]]:
+        """
+        Extract text blocks one page at a time.
 
-                all_text_blocks.extend(text_blocks)
+        Each page's cached layout objects are released before the next page
+        is read, so only the current page is held in memory.
 
-        # Build hierarchical structure
-        sections = self._build_hierarchy(all_text_blocks)
+        Args:
+            pdf_path: Path to PDF file
 
-        return sections
+        Yields:
+            Tuples of (page number, text blocks on that page)
+        """
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                try:
+                    yield page_num, self._extract_text_blocks(page, page_num)
+                finally:
+                    page.close()
+
+    def _extract_page_range(
+        self, pdf_path: Path, start: int, stop: int
+    ) -> List[TextBlock]:
+        """
+        Extract text blocks from a range of pages.
+
+        Args:
+            pdf_path: Path to PDF file
+            start: First page (0-indexed, inclusive)
+            stop: Last page (0-indexed, exclusive)
+
+        Returns:
+            List of TextBlock objects
+        """
+        text_blocks = []
+        with pdfplumber.open(pdf_path) as pdf:
+            for page_num in range(start, stop):
+                text_blocks.extend(
+                    self._extract_text_blocks(pdf.pages[page_num], page_num)
+                )
+        return text_blocks
 
     def _extract_text_blocks(
         self, page: pdfplumber.page.Page, page_num: int
@@ -191,17 +294,21 @@ class HierarchyParser:
 
         return filtered
 
-    def _filter_excluded_regions_smart(
+    def filter_table_regions(
         self, text_blocks: List[TextBlock], exclude_regions: List[BoundingBox]
     ) -> List[TextBlock]:
         """
         Smart filtering that preserves section headings but excludes table content.
 
         Strategy:
-        1. Identify which blocks are headings
-        2. Always preserve heading blocks (even if in table regions)
-        3. For non-headings, calculate overlap ratio with table regions
-        4. Exclude content if overlap > 50% (likely table data)
+        1. Calculate each block's overlap ratio with table regions on its page
+        2. Keep content unless overlap > 50% (likely table data)
+        3. Always preserve heading blocks (even if in table regions)
+
+        Heading detection only runs for blocks that would otherwise be
+        excluded, since every other block is kept either way. Blocks are
+        filtered independently, so this can be applied page by page, e.g. to
+        the blocks from iter_text_blocks.
 
         Args:
             text_blocks: List of text blocks
@@ -212,31 +319,36 @@ class HierarchyParser:
         """
         filtered = []
 
+        # Blocks can only overlap regions on their own page
+        regions_by_page: Dict[int, List[BoundingBox]] = defaultdict(list)
+        for region in exclude_regions:
+            regions_by_page[region.page].append(region)
+
         for block in text_blocks:
-            # Check if this is a heading
-            is_heading = self._detect_heading(block) is not None
+            page_regions = regions_by_page.get(block.bbox.page)
+            if not page_regions:
+                filtered.append(block)
+                continue
 
-            if is_heading:
+            overlap_ratio = self._calculate_max_overlap_ratio(
+                block.bbox, page_regions
+            )
+
+            # Strict exclusion: if >50% overlap with table, exclude it
+            if overlap_ratio < 0.5:
+                filtered.append(block)
+            elif self._detect_heading(block) is not None:
                 # Always keep headings, even if they overlap with tables
                 filtered.append(block)
                 LOGGER.debug(
                     f"Preserved heading: {block.text[:50]}"
                 )
             else:
-                # For non-headings, check overlap with table regions
-                overlap_ratio = self._calculate_max_overlap_ratio(
-                    block.bbox, exclude_regions
+                LOGGER.debug(
+                    f"Excluded content in table region (overlap={overlap_ratio:.1%}): "
+                    f"{block.text[:50]}"
                 )
 
-                # Strict exclusion: if >50% overlap with table, exclude it
-                if overlap_ratio < 0.5:
-                    filtered.append(block)
-                else:
-                    LOGGER.debug(
-                        f"Excluded content in table region (overlap={overlap_ratio:.1%}): "
-                        f"{block.text[:50]}"
-                    )
-
         return filtered
 
     def _calculate_max_overlap_ratio(
@@ -253,7 +365,7 @@ class HierarchyParser:
             Maximum overlap ratio (0.0 to 1.0)
         """
         max_ratio = 0.0
-        bbox_area = bbox.width * bbox.height
+        bbox_area = bbox.area
 
         if bbox_area == 0:
             return 0.0
@@ -277,7 +389,7 @@ class HierarchyParser:
 
         return max_ratio
 
-    def _build_hierarchy(self, text_blocks: List[TextBlock]) -> List[Section]:
+    def build_hierarchy(self, text_blocks: List[TextBlock]) -> List[Section]:
         """
         Build hierarchical section structure from text blocks.
 
@@ -287,6 +399,9 @@ class HierarchyParser:
         - Level 2: Subsections (■, sub-numbers)
         - Level 3: Sub-subsections (○, ▪, •, ▶)
 
+        Sections can span pages, so this needs every block of the document,
+        e.g. collected from a streaming parse and passed in page order.
+
         Args:
             text_blocks: List of text blocks
 
@@ -371,13 +486,13 @@ class HierarchyParser:
         Args:
             sections: List of sections to process (modified in-place)
         """
-        for section in sections:
+        # Walk the whole tree with an explicit stack (order does not matter)
+        stack = list(sections)
+        while stack:
+            section = stack.pop()
             if section.content:
                 section.content = self._merge_bullet_lines(section.content)
-
-            # Recursively process children
-            if section.children:
-                self._consolidate_bullet_paragraphs(section.children)
+            stack.extend(section.children)
 
     def _merge_bullet_lines(self, content_lines: List[str]) -> List[str]:
         """
@@ -442,7 +557,7 @@ class HierarchyParser:
         text = block.text.strip()
 
         # Pattern 1: Parenthesized date/metadata
-        if re.match(r"^\([^)]{5,80}\)$", text):
+        if _SUBTITLE_RE.match(text):
             # Check if previous section was a Level 0 title
             if previous_sections and previous_sections[-1].level == 0:
                 # Check if there are no children yet (subtitle should be first child)
@@ -479,11 +594,12 @@ class HierarchyParser:
         is_small_font = block.font_size and block.font_size < 10
         is_indented = indent_level > 1  # Level 2+ means indented
 
+        match = _NUMBERED_HEADING_RE.match(text)
+
         # Check numbered headings (1., 2., etc.)
-        match = re.match(r"^(\d+)\.\s+(.+)$", text)
-        if match:
-            number = int(match.group(1))
-            title = match.group(2).strip()
+        if match and match.group("number"):
+            number = int(match.group("number"))
+            title = match.group("title").strip()
 
             # INDENTATION-FIRST LOGIC:
             # If small font OR indented, use indentation level instead of default Level 1
@@ -501,17 +617,15 @@ class HierarchyParser:
                 return (1, f"{number}. {title}")
 
         # Check sub-numbered headings (3-1., 3-2., etc.)
-        match = re.match(r"^(\d+)-(\d+)\.\s+(.+)$", text)
-        if match:
-            title = match.group(3).strip()
-            prefix = f"{match.group(1)}-{match.group(2)}"
+        if match and match.group("major"):
+            title = match.group("sub_title").strip()
+            prefix = f"{match.group('major')}-{match.group('minor')}"
             return (2, f"{prefix}. {title}")  # Second-level section
 
         # Check Korean letter headings (가., 나., etc.)
-        match = re.match(r"^([가-힣])\.\s+(.+)$", text)
         if match:
-            letter = match.group(1)
-            title = match.group(2).strip()
+            letter = match.group("letter")
+            title = match.group("letter_title").strip()
             return (3, f"{letter}. {title}")  # Third-level section
 
         # Check bullet points - multiple types
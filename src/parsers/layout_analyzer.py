@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import fitz  # PyMuPDF
 
@@ -29,19 +29,31 @@ class LayoutAnalyzer:
         Returns:
             Dictionary mapping page numbers to layout information
         """
+        return dict(self.iter_pages(pdf_path))
+
+    def iter_pages(self, pdf_path: Path) -> Iterator[Tuple[int, Dict]]:
+        """
+        Analyze PDF layout one page at a time.
+
+        Only the current page's layout is held in memory, so callers that
+        aggregate per-page results avoid materializing the whole document.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Yields:
+            Tuples of (page number, layout information)
+        """
         doc = fitz.open(str(pdf_path))
-        layout_info = {}
 
         try:
             for page_num in range(len(doc)):
                 page = doc[page_num]
-                layout_info[page_num] = self._analyze_page(page, page_num)
+                yield page_num, self._analyze_page(page, page_num)
 
         finally:
             doc.close()
 
-        return layout_info
-
     def _analyze_page(self, page: fitz.Page, page_num: int) -> Dict:
         """
         Analyze a single page.
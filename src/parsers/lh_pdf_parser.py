@@ -2,10 +2,22 @@
 from __future__ import annotations
 
 import logging
+import os
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
-from src.models.document_structure import BoundingBox, Document, Section, TableData
+import numpy as np
+
+from src.models.document_structure import (
+    BoundingBox,
+    Document,
+    PageResult,
+    Section,
+    TableData,
+)
 from src.parsers.hierarchy_parser import HierarchyParser
 from src.parsers.layout_analyzer import LayoutAnalyzer
 from src.parsers.pdf_parser import PDFParser
@@ -24,11 +36,32 @@ class LHPDFParser(PDFParser):
     3. Hierarchy parsing (pdfplumber) - Text structure with Korean heading detection
     """
 
-    def __init__(self) -> None:
-        """Initialize LH PDF parser with all sub-parsers."""
+    def __init__(
+        self, parallel: bool = True, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Initialize LH PDF parser with all sub-parsers.
+
+        Args:
+            parallel: Run text extraction concurrently with table extraction
+            max_workers: Worker processes for table and text extraction
+                (defaults to the CPU count); split between the two stages
+                when they run concurrently
+        """
+        budget = max_workers or os.cpu_count() or 1
+        if parallel:
+            # Both stages' process pools run at once; Camelot is the heavier one
+            text_workers = max(1, budget // 4)
+            table_workers = max(1, budget - text_workers)
+        else:
+            text_workers = table_workers = budget
+
         self.layout_analyzer = LayoutAnalyzer()
-        self.table_extractor = TableExtractor()
-        self.hierarchy_parser = HierarchyParser()
+        self.table_extractor = TableExtractor(max_workers=table_workers)
+        self.hierarchy_parser = HierarchyParser(max_workers=min(8, text_workers))
+        self.parallel = parallel
+        # Full-tree section scans at least this large are scored with NumPy
+        self.vectorize_min_sections = 64
 
     def parse(self, pdf_path: Path) -> Document:
         """
@@ -38,8 +71,16 @@ class LHPDFParser(PDFParser):
         1. Analyze layout to detect potential table regions
         2. Extract tables using Camelot (both lattice and stream modes)
         3. Parse hierarchical text structure, excluding table regions
-        4. Merge tables into their corresponding sections
-        5. Post-process cross-page tables
+        4. Post-process cross-page tables
+        5. Merge tables into their corresponding sections
+
+        The text extraction half of step 3 is an independent read of the PDF
+        and runs concurrently with step 2 when ``parallel`` is enabled (table
+        and text extraction each fan page chunks out to worker processes);
+        only the table-region filtering in step 3 waits for step 2. Step 1
+        runs first on its own: PyMuPDF does not support concurrent use from
+        several threads, and step 2 also uses it in-process (page pre-scan
+        and lattice rendering) for documents that fit in one chunk.
 
         Args:
             pdf_path: Path to LH PDF file
@@ -51,22 +92,27 @@ class LHPDFParser(PDFParser):
 
         # Step 1: Layout analysis - detect table regions
         LOGGER.info("Step 1: Analyzing layout and detecting table regions")
-        layout_info = self.layout_analyzer.analyze(pdf_path)
-
-        # Collect all table regions across pages
-        all_table_regions: List[BoundingBox] = []
-        for page_layout in layout_info.values():
-            all_table_regions.extend(page_layout["table_regions"])
-
-        LOGGER.info(f"Detected {len(all_table_regions)} potential table regions")
 
         # Step 2: Extract tables with both lattice and stream modes
         LOGGER.info("Step 2: Extracting tables using Camelot")
-        tables = self.table_extractor.extract_tables(
-            pdf_path=pdf_path,
-            flavor="both"  # Use both lattice and stream modes
-        )
 
+        # Layout analysis finishes before table extraction starts, so PyMuPDF
+        # is only ever used from one thread at a time
+        table_region_count = self._count_table_regions(pdf_path)
+
+        text_blocks = None
+        if self.parallel:
+            # pdfplumber text extraction overlaps Camelot; it never uses PyMuPDF
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                text_future = executor.submit(
+                    self.hierarchy_parser.extract_text_blocks, pdf_path
+                )
+                tables = self._extract_tables(pdf_path)
+                text_blocks = text_future.result()
+        else:
+            tables = self._extract_tables(pdf_path)
+
+        LOGGER.info(f"Detected {table_region_count} potential table regions")
         LOGGER.info(f"Extracted {len(tables)} tables")
 
         # Step 3: Parse hierarchical structure, excluding table regions
@@ -77,20 +123,18 @@ class LHPDFParser(PDFParser):
 
         sections = self.hierarchy_parser.parse(
             pdf_path=pdf_path,
-            exclude_regions=table_bboxes
+            exclude_regions=table_bboxes,
+            text_blocks=text_blocks,
         )
 
         LOGGER.info(f"Parsed {len(sections)} top-level sections")
 
-        # Step 4: Merge tables into corresponding sections
-        LOGGER.info("Step 4: Merging tables into sections")
-        self._merge_tables_into_sections(sections, tables)
-
-        # Step 5: Post-process for cross-page tables
-        LOGGER.info("Step 5: Processing cross-page tables")
+        # Step 4: Post-process for cross-page tables
+        LOGGER.info("Step 4: Processing cross-page tables")
         merged_tables = self._merge_cross_page_tables(tables)
 
-        # Update sections with merged tables
+        # Step 5: Merge final tables into corresponding sections
+        LOGGER.info("Step 5: Merging tables into sections")
         self._merge_tables_into_sections(sections, merged_tables)
 
         # Create final document
@@ -106,6 +150,126 @@ class LHPDFParser(PDFParser):
         LOGGER.info(f"Successfully parsed document with {len(sections)} sections")
         return document
 
+    def parse_stream(self, pdf_path: Path) -> Iterator[PageResult]:
+        """
+        Parse an LH PDF page by page, yielding each page's text and tables.
+
+        Unlike parse, only the current page's text and the tables of the
+        current page chunk are held in memory. Text blocks are filtered
+        against the page's table regions (headings are kept), and
+        cross-page tables are merged onto the page they start on. A page is
+        yielded once no open table run starting on it can still grow.
+
+        Sections are not built here, since a section's content can span
+        pages; pass the collected text blocks to
+        ``HierarchyParser.build_hierarchy`` if a tree is needed.
+
+        Args:
+            pdf_path: Path to LH PDF file
+
+        Yields:
+            PageResult objects in page order
+        """
+        table_chunks = self.table_extractor.iter_table_chunks(
+            pdf_path=pdf_path, flavor="both"
+        )
+        tables_by_page: Dict[int, List[TableData]] = defaultdict(list)
+        last_table_page = -1  # Tables are known for every page up to this one
+
+        # Pages waiting on open table runs, which are the only lookback kept.
+        # parse() lists all lattice tables before all stream tables, so runs
+        # are tracked per flavor to find the same continuations
+        held: Deque[PageResult] = deque()
+        runs: Dict[str, List[TableData]] = {}
+
+        def close_run(run: List[TableData]) -> None:
+            table = run[0] if len(run) == 1 else self._merge_run(run)
+            start_page = run[0].bbox.page
+            next(r for r in held if r.page == start_page).tables.append(table)
+
+        try:
+            for page_num, text_blocks in self.hierarchy_parser.iter_text_blocks(
+                pdf_path
+            ):
+                # Pull table chunks until this page's tables are all known
+                while last_table_page < page_num:
+                    chunk = next(table_chunks, None)
+                    if chunk is None:
+                        last_table_page = sys.maxsize
+                        break
+                    chunk_pages, chunk_tables = chunk
+                    for table in chunk_tables:
+                        tables_by_page[table.bbox.page].append(table)
+                    last_table_page = max(chunk_pages, default=last_table_page)
+
+                page_tables = tables_by_page.pop(page_num, [])
+                if page_tables:
+                    text_blocks = self.hierarchy_parser.filter_table_regions(
+                        text_blocks, [table.bbox for table in page_tables]
+                    )
+                held.append(PageResult(page=page_num, text_blocks=text_blocks))
+
+                for table in page_tables:
+                    flavor = table.metadata.get("flavor", "")
+                    run = runs.get(flavor)
+                    if run and self._can_merge_tables(run[-1], table):
+                        run.append(table)
+                        continue
+                    if run:
+                        close_run(run)
+                    runs[flavor] = [table]
+
+                # A run can only continue onto the page right after its last
+                for flavor, run in list(runs.items()):
+                    if run[-1].bbox.page < page_num:
+                        close_run(run)
+                        del runs[flavor]
+
+                # Pages before the earliest open run's first page are final
+                open_page = min(
+                    (run[0].bbox.page for run in runs.values()),
+                    default=page_num + 1,
+                )
+                while held and held[0].page < open_page:
+                    yield held.popleft()
+
+            for run in runs.values():
+                close_run(run)
+            yield from held
+        finally:
+            table_chunks.close()
+
+    def _count_table_regions(self, pdf_path: Path) -> int:
+        """
+        Count potential table regions detected by layout analysis.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            Number of detected table regions across all pages
+        """
+        # Stream pages so only one page's layout is held in memory at a time
+        count = 0
+        for _, page_layout in self.layout_analyzer.iter_pages(pdf_path):
+            count += len(page_layout["table_regions"])
+        return count
+
+    def _extract_tables(self, pdf_path: Path) -> List[TableData]:
+        """
+        Extract tables with both lattice and stream modes.
+
+        Args:
+            pdf_path: Path to PDF file
+
+        Returns:
+            List of extracted tables
+        """
+        return self.table_extractor.extract_tables(
+            pdf_path=pdf_path,
+            flavor="both"  # Use both lattice and stream modes
+        )
+
     def validate_pdf(self, pdf_path: Path) -> bool:
         """
         Validate if the file is a readable PDF.
@@ -116,18 +280,32 @@ class LHPDFParser(PDFParser):
         Returns:
             True if valid, False otherwise
         """
-        if not pdf_path.exists():
-            LOGGER.error(f"PDF file not found: {pdf_path}")
-            return False
-
+        # The suffix needs no syscall; a missing file surfaces from open()
         if not pdf_path.suffix.lower() == ".pdf":
             LOGGER.error(f"File is not a PDF: {pdf_path}")
             return False
 
         try:
-            # Try to open with layout analyzer
-            layout_info = self.layout_analyzer.analyze(pdf_path)
-            return len(layout_info) > 0
+            # Probe the header magic and trailing %%EOF instead of parsing pages
+            with open(pdf_path, "rb") as handle:
+                if not handle.read(5) == b"%PDF-":
+                    LOGGER.error(f"File does not have a PDF header: {pdf_path}")
+                    return False
+
+                handle.seek(0, os.SEEK_END)
+                handle.seek(max(0, handle.tell() - 1024))
+                if b"%%EOF" in handle.read():
+                    return True
+
+            # Missing trailer marker: let PyMuPDF decide if the file is readable
+            pages = self.layout_analyzer.iter_pages(pdf_path)
+            try:
+                return next(pages, None) is not None
+            finally:
+                pages.close()
+        except FileNotFoundError:
+            LOGGER.error(f"PDF file not found: {pdf_path}")
+            return False
         except Exception as e:
             LOGGER.error(f"Failed to validate PDF: {e}")
             return False
@@ -141,17 +319,41 @@ class LHPDFParser(PDFParser):
         Tables are assigned to sections based on spatial proximity
         (bounding box overlap or containment).
 
+        Sections are indexed by page once, so each table is first scored only
+        against sections on its own page. A section on another page can earn
+        nothing but its depth bonus, so the full tree is only rescored when
+        the same-page winner does not beat that bound.
+
         Args:
             sections: List of sections (will be modified in-place)
             tables: List of extracted tables
         """
+        candidates = self._flatten_sections(sections)
+        page_index = self._build_page_index(candidates)
+        cross_page_bound = max((depth * 10 for _, depth in candidates), default=0)
+
+        # Column arrays for the full-tree fallback, built on first use
+        vectorize = len(candidates) >= self.vectorize_min_sections
+        section_arrays: Optional[Dict[str, np.ndarray]] = None
+
         for table in tables:
             if not table.bbox:
                 continue
 
-            # Find the best matching section for this table
-            best_section = self._find_best_section_for_table(sections, table)
+            best_section, best_score = self._score_sections(
+                page_index.get(table.bbox.page, []), table
+            )
+            if best_section is None or best_score <= cross_page_bound:
+                if vectorize:
+                    if section_arrays is None:
+                        section_arrays = self._section_arrays(candidates)
+                    best_section, best_score = self._score_sections_vectorized(
+                        candidates, section_arrays, table
+                    )
+                else:
+                    best_section, best_score = self._score_sections(candidates, table)
 
+            self._log_best_match(table, best_section, best_score)
             if best_section:
                 best_section.tables.append(table)
                 LOGGER.debug(
@@ -160,7 +362,10 @@ class LHPDFParser(PDFParser):
                 )
 
     def _find_best_section_for_table(
-        self, sections: List[Section], table: TableData
+        self,
+        sections: List[Section],
+        table: TableData,
+        page_index: Optional[Dict[int, List[Tuple[Section, int]]]] = None,
     ) -> Optional[Section]:
         """
         Find the best matching section for a table.
@@ -174,6 +379,9 @@ class LHPDFParser(PDFParser):
         Args:
             sections: List of sections to search
             table: Table to assign
+            page_index: Optional index from _build_page_index over the same
+                sections; when given, only same-page sections are scored
+                unless a section on another page could still win
 
         Returns:
             Best matching Section or None
@@ -182,74 +390,214 @@ class LHPDFParser(PDFParser):
             return None
 
         best_section: Optional[Section] = None
-        best_score = -1
+        best_score = -1.0
+        if page_index is not None:
+            best_section, best_score = self._score_sections(
+                page_index.get(table.bbox.page, []), table
+            )
+            cross_page_bound = max(
+                (depth * 10 for entries in page_index.values() for _, depth in entries),
+                default=0,
+            )
+            if best_score <= cross_page_bound:
+                best_section = None
+
+        if best_section is None:
+            best_section, best_score = self._score_sections(
+                self._flatten_sections(sections), table
+            )
+        self._log_best_match(table, best_section, best_score)
+
+        return best_section
+
+    @staticmethod
+    def _build_page_index(
+        candidates: List[Tuple[Section, int]]
+    ) -> Dict[int, List[Tuple[Section, int]]]:
+        """
+        Group flattened sections by the page of their bbox.
+
+        Args:
+            candidates: (section, depth) pairs from _flatten_sections
+
+        Returns:
+            Dict mapping page number to its (section, depth) pairs, in pre-order
+        """
+        page_index: Dict[int, List[Tuple[Section, int]]] = defaultdict(list)
+        for section, depth in candidates:
+            page_index[section.bbox.page].append((section, depth))
+        return dict(page_index)
 
-        def score_section(section: Section, depth: int = 0) -> None:
-            nonlocal best_section, best_score
+    @staticmethod
+    def _flatten_sections(sections: List[Section]) -> List[Tuple[Section, int]]:
+        """
+        Flatten the section tree in pre-order, keeping sections with a bbox.
+
+        Args:
+            sections: Top-level sections
+
+        Returns:
+            List of (section, depth) pairs
+        """
+        flat: List[Tuple[Section, int]] = []
+
+        # Pre-order walk with an explicit stack (children pushed in reverse)
+        stack = [(section, 0) for section in reversed(sections)]
+        while stack:
+            section, depth = stack.pop()
+
+            if section.children:
+                stack.extend(
+                    (child, depth + 1) for child in reversed(section.children)
+                )
+
+            if section.bbox:
+                flat.append((section, depth))
 
-            if not section.bbox:
-                # Recursively check children
-                for child in section.children:
-                    score_section(child, depth + 1)
-                return
+        return flat
+
+    def _score_sections(
+        self, candidates: List[Tuple[Section, int]], table: TableData
+    ) -> Tuple[Optional[Section], float]:
+        """
+        Score candidate sections for a table and return the best one.
+
+        Ties keep the earliest candidate in pre-order.
+
+        Args:
+            candidates: (section, depth) pairs from _flatten_sections
+            table: Table to assign
+
+        Returns:
+            Tuple of (best section or None, best score)
+        """
+        best_section: Optional[Section] = None
+        best_score = -1.0
 
-            # Calculate matching score
-            score = 0
-            score_breakdown = {}
+        # Bind hot lookups once for the whole loop
+        table_bbox = table.bbox
+        table_page = table_bbox.page
+        table_y0 = table_bbox.y0
+        overlaps = BoundingBox.overlaps
+        log_scores = LOGGER.isEnabledFor(logging.DEBUG)
+
+        for section, depth in candidates:
+            section_bbox = section.bbox
 
             # Same page bonus
-            if section.bbox.page == table.bbox.page:
-                score += 100
-                score_breakdown["same_page"] = 100
-            else:
-                score_breakdown["same_page"] = 0
+            same_page = section_bbox.page == table_page
+            page_score = 100 if same_page else 0
 
             # Overlap bonus
-            if section.bbox.overlaps(table.bbox):
-                score += 50
-                score_breakdown["overlap"] = 50
-            else:
-                score_breakdown["overlap"] = 0
+            overlap_score = 50 if overlaps(section_bbox, table_bbox) else 0
 
             # Proximity bonus (vertical distance)
-            proximity_score = 0
-            if section.bbox.page == table.bbox.page:
-                # Table below section heading
-                if table.bbox.y0 >= section.bbox.y1:
-                    vertical_distance = table.bbox.y0 - section.bbox.y1
-                    # Closer is better (max 50 points)
-                    proximity_score = max(0, 50 - vertical_distance / 10)
-                    score += proximity_score
-            score_breakdown["proximity"] = proximity_score
+            proximity_score = 0.0
+            if same_page and table_y0 >= section_bbox.y1:
+                # Table below section heading; closer is better (max 50 points)
+                vertical_distance = table_y0 - section_bbox.y1
+                proximity_score = max(0, 50 - vertical_distance / 10)
 
             # Depth bonus (prefer more specific sections)
             depth_score = depth * 10
-            score += depth_score
-            score_breakdown["depth"] = depth_score
 
-            # Log scoring details
-            LOGGER.debug(
-                f"Scoring section '{section.title}' (L{section.level}) "
-                f"for table on page {table.bbox.page}: "
-                f"total={score:.1f} "
-                f"(page={score_breakdown['same_page']}, "
-                f"overlap={score_breakdown['overlap']}, "
-                f"prox={score_breakdown['proximity']:.1f}, "
-                f"depth={score_breakdown['depth']})"
-            )
+            score = page_score + overlap_score + proximity_score + depth_score
+
+            if log_scores:
+                LOGGER.debug(
+                    f"Scoring section '{section.title}' (L{section.level}) "
+                    f"for table on page {table_page}: "
+                    f"total={score:.1f} "
+                    f"(page={page_score}, "
+                    f"overlap={overlap_score}, "
+                    f"prox={proximity_score:.1f}, "
+                    f"depth={depth_score})"
+                )
 
             if score > best_score:
                 best_score = score
                 best_section = section
 
-            # Check children
-            for child in section.children:
-                score_section(child, depth + 1)
+        return best_section, best_score
+
+    @staticmethod
+    def _section_arrays(
+        candidates: List[Tuple[Section, int]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Pack candidate section boxes into column arrays for vectorized scoring.
+
+        Args:
+            candidates: (section, depth) pairs from _flatten_sections
+
+        Returns:
+            Arrays keyed by 'page', 'x0', 'y0', 'x1', 'y1' and 'depth_score'
+        """
+        bboxes = [section.bbox for section, _ in candidates]
+        return {
+            "page": np.array([bbox.page for bbox in bboxes], dtype=np.int64),
+            "x0": np.array([bbox.x0 for bbox in bboxes], dtype=np.float64),
+            "y0": np.array([bbox.y0 for bbox in bboxes], dtype=np.float64),
+            "x1": np.array([bbox.x1 for bbox in bboxes], dtype=np.float64),
+            "y1": np.array([bbox.y1 for bbox in bboxes], dtype=np.float64),
+            "depth_score": np.array(
+                [depth * 10 for _, depth in candidates], dtype=np.float64
+            ),
+        }
+
+    def _score_sections_vectorized(
+        self,
+        candidates: List[Tuple[Section, int]],
+        arrays: Dict[str, np.ndarray],
+        table: TableData,
+    ) -> Tuple[Optional[Section], float]:
+        """
+        Vectorized equivalent of _score_sections for large candidate lists.
+
+        Computes the same scores in float64 and breaks ties the same way
+        (np.argmax returns the first maximum), so both always pick the same
+        section. Per-section debug logging falls back to the scalar path.
+
+        Args:
+            candidates: (section, depth) pairs from _flatten_sections
+            arrays: Column arrays from _section_arrays for the same candidates
+            table: Table to assign
+
+        Returns:
+            Tuple of (best section or None, best score)
+        """
+        if not candidates or LOGGER.isEnabledFor(logging.DEBUG):
+            return self._score_sections(candidates, table)
+
+        table_bbox = table.bbox
+        table_y0 = table_bbox.y0
+        y1 = arrays["y1"]
+
+        same_page = arrays["page"] == table_bbox.page
+        overlapping = same_page & ~(
+            (arrays["x1"] < table_bbox.x0)
+            | (arrays["x0"] > table_bbox.x1)
+            | (y1 < table_y0)
+            | (arrays["y0"] > table_bbox.y1)
+        )
+        proximity = np.where(
+            same_page & (table_y0 >= y1),
+            np.maximum(0.0, 50 - (table_y0 - y1) / 10),
+            0.0,
+        )
+
+        scores = (
+            same_page * 100.0 + overlapping * 50.0 + proximity + arrays["depth_score"]
+        )
+        best = int(np.argmax(scores))
 
-        # Score all sections
-        for section in sections:
-            score_section(section)
+        return candidates[best][0], float(scores[best])
 
+    @staticmethod
+    def _log_best_match(
+        table: TableData, best_section: Optional[Section], best_score: float
+    ) -> None:
+        """Log the outcome of matching a table to a section."""
         if best_section:
             LOGGER.debug(
                 f"Best match for table on page {table.bbox.page}: "
@@ -262,8 +610,6 @@ class LHPDFParser(PDFParser):
                 f"at position ({table.bbox.x0:.1f}, {table.bbox.y0:.1f})"
             )
 
-        return best_section
-
     def _merge_cross_page_tables(
         self, tables: List[TableData]
     ) -> List[TableData]:
@@ -286,34 +632,26 @@ class LHPDFParser(PDFParser):
             return tables
 
         merged: List[TableData] = []
-        skip_indices = set()
-
-        for i, table in enumerate(tables):
-            if i in skip_indices:
-                continue
+        log_merges = LOGGER.isEnabledFor(logging.INFO)
 
-            # Try to find continuation tables
-            current_table = table
+        # Continuations are always contiguous: collect each run of fragments
+        # (each compared with the one before it), then merge the run at once
+        i = 0
+        n = len(tables)
+        while i < n:
             j = i + 1
+            while j < n and self._can_merge_tables(tables[j - 1], tables[j]):
+                j += 1
 
-            while j < len(tables):
-                next_table = tables[j]
-
-                if self._can_merge_tables(current_table, next_table):
-                    # Merge next_table into current_table
-                    current_table = self._merge_two_tables(
-                        current_table, next_table
-                    )
-                    skip_indices.add(j)
-                    LOGGER.info(
-                        f"Merged table from page {table.bbox.page} "
-                        f"with page {next_table.bbox.page}"
-                    )
-                    j += 1
-                else:
-                    break
-
-            merged.append(current_table)
+            if j - i == 1:
+                merged.append(tables[i])
+            else:
+                run = tables[i:j]
+                merged.append(self._merge_run(run))
+                if log_merges:
+                    pages = [table.bbox.page for table in run]
+                    LOGGER.info(f"Merged table across pages {pages}")
+            i = j
 
         LOGGER.info(
             f"Merged {len(tables) - len(merged)} cross-page tables"
@@ -336,12 +674,14 @@ class LHPDFParser(PDFParser):
         if not table1.bbox or not table2.bbox:
             return False
 
+        # Cheapest checks first; the DataFrame is only consulted at the end
+
         # Must be on consecutive pages
         if table2.bbox.page != table1.bbox.page + 1:
             return False
 
-        # Must have same number of columns
-        if len(table1.dataframe.columns) != len(table2.dataframe.columns):
+        # Check if table2 is at top of page (continuation table indicator)
+        if table2.bbox.y0 > 100:  # Should start near top of page
             return False
 
         # Check horizontal alignment (x-coordinates should be similar)
@@ -349,11 +689,8 @@ class LHPDFParser(PDFParser):
         if x_diff > 10:  # 10 pixel tolerance
             return False
 
-        # Check if table2 is at top of page (continuation table indicator)
-        if table2.bbox.y0 > 100:  # Should start near top of page
-            return False
-
-        return True
+        # Must have same number of columns
+        return table1.dataframe.shape[1] == table2.dataframe.shape[1]
 
     def _merge_two_tables(
         self, table1: TableData, table2: TableData
@@ -368,60 +705,68 @@ class LHPDFParser(PDFParser):
         Returns:
             Merged table
         """
-        import pandas as pd
+        return self._merge_run([table1, table2])
 
-        # Reset both row and column indices to avoid conflicts
-        df1 = table1.dataframe.copy()
-        df2 = table2.dataframe.copy()
+    def _merge_run(self, run: List[TableData]) -> TableData:
+        """
+        Merge a run of continuation tables into one table.
 
-        # Reset row index
-        df1 = df1.reset_index(drop=True)
-        df2 = df2.reset_index(drop=True)
+        Rows are stacked in a single concatenation, so a table spanning N
+        pages is copied once rather than re-copied for every fragment.
 
-        # Ensure column names are unique by resetting them if needed
-        if df1.columns.duplicated().any():
-            df1.columns = range(len(df1.columns))
-        if df2.columns.duplicated().any():
-            df2.columns = range(len(df2.columns))
+        Args:
+            run: Tables in page order (at least one)
 
-        # Concatenate dataframes
+        Returns:
+            Merged table
+        """
+        import pandas as pd
+
+        first = run[0]
+
+        # Ensure column names are unique by resetting them if needed
+        columns = first.dataframe.columns
+        if columns.duplicated().any():
+            columns = pd.RangeIndex(len(columns))
+
+        # Stack rows positionally: cells are plain strings and continuation
+        # tables share the column count, so no pandas alignment is needed.
+        # The source tables are discarded after merging, so nothing is copied
+        # beyond the one concatenation
         try:
-            merged_df = pd.concat(
-                [df1, df2],
-                axis=0,
-                ignore_index=True,
-                sort=False
+            merged_df = pd.DataFrame(
+                np.concatenate([table.dataframe.to_numpy() for table in run], axis=0),
+                columns=columns,
             )
         except Exception as e:
             LOGGER.warning(
                 f"Failed to merge tables with error: {e}. "
                 f"Using first table only."
             )
-            merged_df = df1
+            merged_df = first.dataframe
 
-        # Update bounding box to cover both tables
-        if table1.bbox and table2.bbox:
+        # Update bounding box to cover the whole run
+        if all(table.bbox for table in run):
             merged_bbox = BoundingBox(
-                x0=min(table1.bbox.x0, table2.bbox.x0),
-                y0=table1.bbox.y0,  # Start of first table
-                x1=max(table1.bbox.x1, table2.bbox.x1),
-                y1=table2.bbox.y1,  # End of second table
-                page=table1.bbox.page,  # Start page
+                x0=min(table.bbox.x0 for table in run),
+                y0=first.bbox.y0,  # Start of first table
+                x1=max(table.bbox.x1 for table in run),
+                y1=run[-1].bbox.y1,  # End of last table
+                page=first.bbox.page,  # Start page
             )
         else:
-            merged_bbox = table1.bbox
+            merged_bbox = first.bbox
 
         # Merge metadata
-        merged_metadata = table1.metadata.copy()
+        merged_metadata = first.metadata.copy()
         merged_metadata["merged_from_pages"] = [
-            table1.bbox.page if table1.bbox else -1,
-            table2.bbox.page if table2.bbox else -1,
+            table.bbox.page if table.bbox else -1 for table in run
         ]
 
         return TableData(
             dataframe=merged_df,
             bbox=merged_bbox,
-            page=table1.page,
+            page=first.page,
             metadata=merged_metadata
         )
 
@@ -435,7 +780,10 @@ class LHPDFParser(PDFParser):
         Returns:
             Total count
         """
-        count = len(sections)
-        for section in sections:
-            count += self._count_all_sections(section.children)
+        count = 0
+        stack = list(sections)
+        while stack:
+            section = stack.pop()
+            count += 1
+            stack.extend(section.children)
         return count
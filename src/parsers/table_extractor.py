@@ -1,25 +1,299 @@
 """Table extraction using Camelot for complex table structures."""
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import pickle
+import shutil
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
-import camelot
+import fitz  # PyMuPDF
 import pandas as pd
+from camelot.core import TableList
+from camelot.handlers import PDFHandler
+from camelot.parsers import Lattice, Stream
+from camelot.utils import get_page_layout, get_rotation, get_text_objects
+from pypdf import PdfReader, PdfWriter
 
+from src.common.workers import worker_context
 from src.models.document_structure import BoundingBox, TableData
 
 LOGGER = logging.getLogger(__name__)
 
+# Bump when extraction, cleaning or scoring changes what extract_tables
+# returns, so cached results from older code are not served
+_CACHE_VERSION = 1
+
+
+class _PyMuPDFBackend:
+    """
+    Camelot lattice image backend that renders pages in-process with PyMuPDF.
+
+    Camelot's Ghostscript backend (the default) wraps a global, non-reentrant
+    interpreter, and its poppler backend shells out to ``pdftopng`` per page.
+    PyMuPDF is already a dependency and renders without either.
+
+    PyMuPDF does not support concurrent use from several threads, so
+    rendering must not overlap other PyMuPDF work in the same process (for
+    example, layout analysis). ``LHPDFParser.parse`` finishes its layout pass
+    before table extraction starts, and worker processes each have their own
+    PyMuPDF instance.
+    """
+
+    def convert(self, pdf_path: str, png_path: str, resolution: int = 300) -> None:
+        """
+        Render the first page of a single-page PDF to PNG.
+
+        Args:
+            pdf_path: Split page PDF written by the handler
+            png_path: Destination image path expected by Camelot
+            resolution: Render resolution in DPI (Ghostscript backend default)
+        """
+        with fitz.open(pdf_path) as doc:
+            doc[0].get_pixmap(dpi=resolution).save(png_path)
+
+
+_LATTICE_BACKEND = _PyMuPDFBackend()
+
+
+class _SplitPDFHandler(PDFHandler):
+    """
+    Camelot PDF handler that keeps its single-page split files between parses.
+
+    ``camelot.read_pdf`` builds a fresh handler per call, so extracting with
+    both lattice and stream splits (and re-reads) every page twice. This
+    handler splits each page the first time it is parsed and reuses the
+    files until ``close``. The source PDF is parsed once per handler and
+    shared by page range resolution, splitting and page areas, where
+    ``PDFHandler`` re-opens it for the page count and again for every page;
+    the PyMuPDF pre-scan likewise shares one open document.
+    """
+
+    def __init__(
+        self, filepath: str, pages: str = "1", password: Optional[str] = None
+    ) -> None:
+        self._reader: Optional[PdfReader] = None  # Needed by _get_pages
+        super().__init__(filepath, pages=pages, password=password)
+        self._tempdir: Optional[str] = None
+        self._split_pages: Set[int] = set()
+        self._page_areas: Dict[int, float] = {}
+        self._fitz_doc: Optional[fitz.Document] = None
+
+    def __enter__(self) -> _SplitPDFHandler:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the split page files and release the parsed source PDF."""
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+            self._split_pages.clear()
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        self._reader = None
+
+    def page_area(self, page: int) -> float:
+        """
+        Return the media box area of a page in PDF points.
+
+        Args:
+            page: Page number (1-indexed, as in Camelot)
+
+        Returns:
+            Page area
+        """
+        if page not in self._page_areas:
+            mediabox = self._open_reader().pages[page - 1].mediabox
+            self._page_areas[page] = float(mediabox.width) * float(mediabox.height)
+        return self._page_areas[page]
+
+    def fitz_document(self) -> fitz.Document:
+        """Open (and authenticate, if needed) the source PDF in PyMuPDF once."""
+        if self._fitz_doc is None:
+            doc = fitz.open(self.filepath)
+            if doc.needs_pass:
+                doc.authenticate(self.password)
+            self._fitz_doc = doc
+        return self._fitz_doc
+
+    def _open_reader(self) -> PdfReader:
+        """Parse (and decrypt, if needed) the source PDF on first use."""
+        if self._reader is None:
+            # pypdf reads a path fully into memory, so no file handle is kept
+            reader = PdfReader(self.filepath, strict=False)
+            if reader.is_encrypted:
+                reader.decrypt(self.password)
+            self._reader = reader
+        return self._reader
+
+    def _get_pages(self, pages: str) -> List[int]:
+        """
+        Convert a Camelot page spec ('1,3-5', '2-end', 'all') to page numbers.
+
+        Explicit numeric specs, as used for worker chunks, are resolved
+        without opening the PDF; 'all' and 'end' take the page count from
+        the shared reader.
+
+        Args:
+            pages: Comma-separated page numbers and ranges
+
+        Returns:
+            Sorted, de-duplicated 1-indexed page numbers
+        """
+        if pages == "all":
+            return list(range(1, len(self._open_reader().pages) + 1))
+
+        page_numbers = set()
+        for part in pages.split(","):
+            if "-" in part:
+                start, end = part.split("-")
+                last = len(self._open_reader().pages) if end == "end" else int(end)
+                page_numbers.update(range(int(start), last + 1))
+            else:
+                page_numbers.add(int(part))
+        return sorted(page_numbers)
+
+    def _split(self, pages: Optional[List[int]] = None) -> None:
+        """
+        Write pages that are not split yet to their own files in the temp dir.
+
+        Args:
+            pages: 1-indexed pages to split; all handler pages if None
+        """
+        if self._tempdir is None:
+            self._tempdir = tempfile.mkdtemp(prefix="camelot-")
+        for page in self.pages if pages is None else pages:
+            if page not in self._split_pages:
+                self._save_page(self.filepath, page, self._tempdir)
+                self._split_pages.add(page)
+
+    def _save_page(self, filepath: str, page: int, temp: str) -> None:
+        """
+        Save one page to ``temp`` from the shared reader.
+
+        Mirrors ``PDFHandler._save_page``, including the rotation fix for
+        pages with mostly vertical text, but rotates the page in memory
+        rather than re-reading the written file.
+
+        Args:
+            filepath: Path of the source PDF
+            page: Page number (1-indexed)
+            temp: Directory for the split page files
+        """
+        pdf_page = self._open_reader().pages[page - 1]
+        mediabox = pdf_page.mediabox
+        self._page_areas[page] = float(mediabox.width) * float(mediabox.height)
+
+        page_path = os.path.join(temp, f"page-{page}.pdf")
+        writer = PdfWriter()
+        writer.add_page(pdf_page)
+        with open(page_path, "wb") as page_file:
+            writer.write(page_file)
+
+        layout, _ = get_page_layout(page_path)
+        rotation = get_rotation(
+            get_text_objects(layout, ltype="char"),
+            get_text_objects(layout, ltype="horizontal_text"),
+            get_text_objects(layout, ltype="vertical_text"),
+        )
+        if rotation:
+            writer.pages[0].rotate(90 if rotation == "anticlockwise" else -90)
+            with open(page_path, "wb") as page_file:
+                writer.write(page_file)
+
+    def parse(
+        self,
+        flavor="lattice",
+        suppress_stdout=False,
+        layout_kwargs=None,
+        pages: Optional[List[int]] = None,
+        **kwargs,
+    ) -> TableList:
+        """
+        Extract tables from the handler's pages, splitting each on first use.
+
+        Args:
+            flavor: Camelot flavor ('lattice' or 'stream')
+            suppress_stdout: Suppress Camelot logs and warnings
+            layout_kwargs: pdfminer LAParams kwargs
+            pages: Subset of the handler's pages to parse (1-indexed);
+                all pages if None
+            **kwargs: Flavor-specific Camelot parser options
+
+        Returns:
+            Camelot TableList sorted by page and order
+        """
+        if pages is None:
+            pages = self.pages
+        self._split(pages)
+
+        if flavor == "lattice":
+            parser = Lattice(backend=_LATTICE_BACKEND, **kwargs)
+        else:
+            parser = Stream(**kwargs)
+
+        tables = []
+        for page in pages:
+            page_path = os.path.join(self._tempdir, f"page-{page}.pdf")
+            page_tables = parser.extract_tables(
+                page_path,
+                suppress_stdout=suppress_stdout,
+                layout_kwargs=layout_kwargs or {},
+            )
+
+            # Drop plotting data (lattice keeps the rendered page image per
+            # table) so it is not pinned for the rest of the document
+            for table in page_tables:
+                table._image = None
+                table._segments = None
+                table._text = None
+                table._textedges = None
+
+            tables.extend(page_tables)
+
+        return TableList(sorted(tables))
+
 
 class TableExtractor:
     """Extracts tables from PDF using Camelot."""
 
-    def __init__(self) -> None:
-        """Initialize table extractor."""
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_chunk: int = 20,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize table extractor.
+
+        Args:
+            max_workers: Worker processes for multi-chunk documents
+                (defaults to the CPU count; 1 disables the process pool)
+            pages_per_chunk: Pages handed to each worker process
+            cache_dir: Directory for cached extract_tables results, keyed by
+                PDF content hash (e.g. ~/.cache/table_extractor); None
+                disables caching
+        """
         self.min_accuracy = 50  # Minimum table accuracy threshold (for initial filter)
         self.min_quality_score = 0.5  # Minimum comprehensive quality score (0-1)
+        # Lattice results that let a page skip the (slower) stream pass
+        self.stream_skip_accuracy = 90  # Minimum lattice accuracy to trust a table
+        self.stream_skip_coverage = 0.8  # Minimum fraction of the page covered
+        # Horizontal and vertical segments a page needs to be worth a lattice pass
+        self.min_ruling_lines = 2
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.pages_per_chunk = pages_per_chunk
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
     def extract_tables(
         self,
@@ -30,6 +304,11 @@ class TableExtractor:
         """
         Extract all tables from PDF.
 
+        Documents longer than ``pages_per_chunk`` are split into page chunks
+        that are extracted in a process pool; PyMuPDF (used for the page
+        pre-scan and lattice rendering) does not support concurrent use from
+        several threads, so threads are not an option.
+
         Args:
             pdf_path: Path to PDF file
             pages: Page range (e.g., '1-3' or 'all')
@@ -41,92 +320,599 @@ class TableExtractor:
         if pages is None:
             pages = "all"
 
-        tables = []
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(pdf_path, pages, flavor)
+            if cache_path.exists():
+                try:
+                    with open(cache_path, "rb") as cache_file:
+                        cached_tables = pickle.load(cache_file)
+                    LOGGER.debug(f"Using cached tables for {pdf_path}: {cache_path}")
+                    return cached_tables
+                except Exception as exc:
+                    LOGGER.warning(f"Ignoring unreadable table cache {cache_path}: {exc}")
 
-        try:
-            # Try lattice mode first (better for line-based tables)
-            if flavor in ("lattice", "both"):
-                lattice_tables = self._extract_with_flavor(
-                    pdf_path, pages, "lattice"
-                )
-                tables.extend(lattice_tables)
+        tables: List[TableData] = []
 
-            # Try stream mode (better for tables without lines)
-            if flavor in ("stream", "both"):
-                stream_tables = self._extract_with_flavor(
-                    pdf_path, pages, "stream"
-                )
+        try:
+            # Split the PDF once and share the page files between flavors
+            with _SplitPDFHandler(str(pdf_path), pages=pages) as handler:
+                chunks = self._chunk_pages(handler.pages)
+                if len(chunks) > 1 and self.max_workers > 1:
+                    results = self._map_chunks(
+                        self._extract_chunk,
+                        [(pdf_path, chunk, flavor) for chunk in chunks],
+                    )
+                else:
+                    results = [self._extract_from_handler(handler, flavor)]
 
-                # Only add stream tables that don't overlap with lattice tables
-                for stream_table in stream_tables:
-                    if not self._overlaps_with_existing(stream_table, tables):
-                        tables.append(stream_table)
+            tables = self._merge_flavors(results)
 
         except Exception as exc:
             LOGGER.warning(f"Table extraction failed for {pdf_path}: {exc}")
+            return tables
+
+        if cache_path is not None:
+            # A failed pass looks like a page without tables; never cache it
+            if all(complete for _, _, complete in results):
+                self._write_cache(cache_path, tables)
+            else:
+                LOGGER.debug(f"Not caching incomplete table extraction for {pdf_path}")
 
         return tables
 
-    def _extract_with_flavor(
-        self, pdf_path: Path, pages: str, flavor: str
+    def open(self, pdf_path: Path, pages: Optional[str] = None) -> _SplitPDFHandler:
+        """
+        Open a PDF once for repeated extract_page calls.
+
+        The returned handler is a context manager; pages are split on first
+        use, and the parsed PDF and split files are released on close.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Page range (e.g., '1-3' or 'all')
+
+        Returns:
+            Camelot PDF handler for the document and page range
+        """
+        return _SplitPDFHandler(str(pdf_path), pages=pages or "all")
+
+    def extract_page(
+        self, handler: _SplitPDFHandler, page: int, flavor: str = "lattice"
     ) -> List[TableData]:
         """
-        Extract tables using specified Camelot flavor.
+        Extract tables from one page of a PDF opened with open().
+
+        Args:
+            handler: Handler returned by open()
+            page: Page number (0-indexed)
+            flavor: 'lattice', 'stream', or 'both'
+
+        Returns:
+            List of TableData objects
+        """
+        try:
+            return self._merge_flavors(
+                [self._extract_from_handler(handler, flavor, pages=[page + 1])]
+            )
+        except Exception as exc:
+            LOGGER.warning(
+                f"Table extraction failed for {handler.filepath} page {page}: {exc}"
+            )
+            return []
+
+    def _cache_path(self, pdf_path: Path, pages: str, flavor: str) -> Path:
+        """
+        Build the cache file path for an extract_tables call.
+
+        The key covers the PDF bytes, the page range and flavor, the
+        filtering thresholds and ``_CACHE_VERSION``, so changing any of them
+        misses the cache.
 
         Args:
             pdf_path: Path to PDF file
             pages: Page range
-            flavor: Camelot flavor ('lattice' or 'stream')
+            flavor: 'lattice', 'stream', or 'both'
 
         Returns:
-            List of TableData objects
+            Path of the pickle file for this call
         """
-        tables = []
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as pdf_file:
+            for block in iter(lambda: pdf_file.read(1 << 20), b""):
+                digest.update(block)
+
+        settings = (
+            f"{_CACHE_VERSION}|{pages}|{flavor}|"
+            f"{self.min_accuracy}|{self.min_quality_score}|"
+            f"{self.stream_skip_accuracy}|{self.stream_skip_coverage}|"
+            f"{self.min_ruling_lines}"
+        )
+        settings_digest = hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+        return self.cache_dir / f"{digest.hexdigest()}_{flavor}_{settings_digest}.pkl"
+
+    def _write_cache(self, cache_path: Path, tables: List[TableData]) -> None:
+        """
+        Pickle extracted tables to the cache, ignoring write failures.
+
+        Args:
+            cache_path: Destination from _cache_path
+            tables: Extracted tables
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial file
+            partial_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(partial_path, "wb") as cache_file:
+                pickle.dump(tables, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+        except OSError as exc:
+            LOGGER.warning(f"Could not write table cache {cache_path}: {exc}")
+
+    def extract_tables_streaming(
+        self,
+        pdf_path: Path,
+        pages: Optional[str] = None,
+        flavor: str = "lattice",
+    ) -> Iterator[TableData]:
+        """
+        Lazily extract tables, holding at most one page chunk in memory.
 
+        Each chunk's accepted tables are pickled to a temporary directory as
+        soon as they are extracted, and read back one chunk at a time while
+        iterating. Unlike extract_tables, lattice and stream tables are
+        interleaved per chunk rather than across the whole document.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Page range (e.g., '1-3' or 'all')
+            flavor: 'lattice' for line-based tables, 'stream' for whitespace-based
+
+        Yields:
+            TableData objects in page-chunk order
+        """
+        for _, chunk_tables in self.iter_table_chunks(pdf_path, pages, flavor):
+            yield from chunk_tables
+
+    def iter_table_chunks(
+        self,
+        pdf_path: Path,
+        pages: Optional[str] = None,
+        flavor: str = "lattice",
+    ) -> Iterator[Tuple[List[int], List[TableData]]]:
+        """
+        Lazily extract tables one page chunk at a time.
+
+        Like extract_tables_streaming, but also reports which pages each
+        chunk covered, so callers know when a page's tables are complete
+        even if it has none. Each chunk is yielded as soon as it and every
+        earlier chunk have been extracted; if extraction fails partway, the
+        chunks already yielded stand and iteration stops with a warning.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Page range (e.g., '1-3' or 'all')
+            flavor: 'lattice' for line-based tables, 'stream' for whitespace-based
+
+        Yields:
+            Tuples of (0-indexed pages in the chunk, tables on those pages)
+        """
+        if pages is None:
+            pages = "all"
+
+        spill_dir = tempfile.mkdtemp(prefix="tables-")
+        spilled = None
         try:
-            if flavor == "lattice":
-                camelot_tables = camelot.read_pdf(
-                    str(pdf_path),
-                    pages=pages,
-                    flavor="lattice",
-                    line_scale=40,  # Sensitivity for detecting lines
-                    copy_text=["v"],  # Vertical text handling
+            try:
+                with _SplitPDFHandler(str(pdf_path), pages=pages) as handler:
+                    page_numbers = handler.pages
+                chunks = self._chunk_pages(page_numbers)
+                spill_paths = [
+                    os.path.join(spill_dir, f"tables-{index}.pkl")
+                    for index in range(len(chunks))
+                ]
+                spilled = self._iter_chunks(
+                    self._spill_chunk,
+                    [
+                        (pdf_path, chunk, flavor, spill_path)
+                        for chunk, spill_path in zip(chunks, spill_paths)
+                    ],
+                )
+                # Chunks are yielded as they finish, so a failure surfaces mid-iteration
+                for chunk, spill_path, _ in zip(chunks, spill_paths, spilled):
+                    with open(spill_path, "rb") as spill_file:
+                        chunk_tables = pickle.load(spill_file)
+                    os.remove(spill_path)
+                    yield [int(page) - 1 for page in chunk.split(",")], chunk_tables
+            except Exception as exc:
+                LOGGER.warning(f"Table extraction failed for {pdf_path}: {exc}")
+        finally:
+            # Stops pending chunks (and waits for running ones) if closed early
+            if spilled is not None:
+                spilled.close()
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+    def _spill_chunk(
+        self, pdf_path: Path, pages: str, flavor: str, spill_path: str
+    ) -> None:
+        """
+        Extract one page chunk and pickle its accepted tables.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Camelot page spec for the chunk
+            flavor: 'lattice', 'stream', or 'both'
+            spill_path: Destination pickle file
+        """
+        tables = self._merge_flavors([self._extract_chunk(pdf_path, pages, flavor)])
+
+        with open(spill_path, "wb") as spill_file:
+            pickle.dump(tables, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _merge_flavors(
+        self, results: List[Tuple[List[TableData], List[TableData], bool]]
+    ) -> List[TableData]:
+        """
+        Combine lattice and stream results, dropping overlapping stream tables.
+
+        Args:
+            results: (lattice tables, stream tables, complete) per chunk
+
+        Returns:
+            Lattice tables followed by non-overlapping stream tables
+        """
+        tables = []
+        # Accepted tables bucketed by page; tables on different pages never overlap
+        tables_by_page: Dict[int, List[TableData]] = defaultdict(list)
+
+        # Lattice tables first (better for line-based tables)
+        for lattice_tables, _, _ in results:
+            tables.extend(lattice_tables)
+            for table in lattice_tables:
+                tables_by_page[table.bbox.page].append(table)
+
+        # Only add stream tables that don't overlap with lattice tables
+        for _, stream_tables, _ in results:
+            for stream_table in stream_tables:
+                page_tables = tables_by_page[stream_table.bbox.page]
+                if not self._overlaps_with_existing(stream_table, page_tables):
+                    tables.append(stream_table)
+                    page_tables.append(stream_table)
+
+        return tables
+
+    def _chunk_pages(self, pages: List[int]) -> List[str]:
+        """
+        Split page numbers into Camelot page specs of ``pages_per_chunk`` pages.
+
+        Args:
+            pages: 1-indexed page numbers
+
+        Returns:
+            Comma-separated page specs, one per chunk
+        """
+        size = self.pages_per_chunk
+        return [
+            ",".join(str(page) for page in pages[start:start + size])
+            for start in range(0, len(pages), size)
+        ]
+
+    def _map_chunks(self, func: Callable, chunk_args: List[Tuple]) -> List:
+        """
+        Run a chunk function over page chunks, in worker processes if useful.
+
+        Args:
+            func: Picklable callable (bound method) run once per chunk
+            chunk_args: Positional arguments for each call, in chunk order
+
+        Returns:
+            Results in chunk order
+        """
+        return list(self._iter_chunks(func, chunk_args))
+
+    def _iter_chunks(self, func: Callable, chunk_args: List[Tuple]) -> Iterator:
+        """
+        Lazily run a chunk function over page chunks, in worker processes if useful.
+
+        All chunks are submitted up front and each result is yielded, in chunk
+        order, as soon as it is ready. Closing the iterator early cancels the
+        chunks that have not started yet.
+
+        Falls back to running the remaining chunks in-process if the pool
+        breaks, e.g. when a worker cannot start because the calling script
+        lacks an ``if __name__ == "__main__"`` guard.
+
+        Args:
+            func: Picklable callable (bound method) run once per chunk
+            chunk_args: Positional arguments for each call, in chunk order
+
+        Yields:
+            Results in chunk order
+        """
+        done = 0
+        if len(chunk_args) > 1 and self.max_workers > 1:
+            workers = min(self.max_workers, len(chunk_args))
+            LOGGER.debug(
+                f"Extracting {len(chunk_args)} page chunks with {workers} workers"
+            )
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers, mp_context=worker_context()
+                ) as executor:
+                    futures = [executor.submit(func, *args) for args in chunk_args]
+                    try:
+                        for future in futures:
+                            result = future.result()
+                            done += 1
+                            yield result
+                    finally:
+                        executor.shutdown(cancel_futures=True)
+                return
+            except BrokenProcessPool as exc:
+                LOGGER.warning(f"Worker pool failed, extracting in-process: {exc}")
+
+        for args in chunk_args[done:]:
+            yield func(*args)
+
+    def _extract_chunk(
+        self, pdf_path: Path, pages: str, flavor: str
+    ) -> Tuple[List[TableData], List[TableData], bool]:
+        """
+        Extract one page chunk with its own PDF handler.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Camelot page spec for the chunk
+            flavor: 'lattice', 'stream', or 'both'
+
+        Returns:
+            Tuple of (lattice tables, stream tables, whether every pass
+            succeeded)
+        """
+        with _SplitPDFHandler(str(pdf_path), pages=pages) as handler:
+            return self._extract_from_handler(handler, flavor)
+
+    def _extract_from_handler(
+        self,
+        handler: _SplitPDFHandler,
+        flavor: str,
+        pages: Optional[List[int]] = None,
+    ) -> Tuple[List[TableData], List[TableData], bool]:
+        """
+        Run the requested Camelot flavors over a handler's pages.
+
+        A failed flavor pass is logged and contributes no tables, so the
+        other flavor's results are still returned.
+
+        Args:
+            handler: Camelot PDF handler for the document and page range
+            flavor: 'lattice', 'stream', or 'both'
+            pages: Subset of the handler's pages (1-indexed); all if None
+
+        Returns:
+            Tuple of (lattice tables, stream tables, whether every pass
+            succeeded) before overlap filtering
+        """
+        lattice_tables: List[TableData] = []
+        stream_tables: List[TableData] = []
+        complete = True
+
+        # Cheap PyMuPDF pre-scan so Camelot never renders pages it cannot use
+        ruled_pages, text_pages = self._scan_pages(handler, pages)
+
+        if flavor in ("lattice", "both") and ruled_pages:
+            try:
+                lattice_tables = self._extract_with_flavor(
+                    handler, "lattice", ruled_pages
                 )
-            else:  # stream
-                camelot_tables = camelot.read_pdf(
-                    str(pdf_path),
-                    pages=pages,
-                    flavor="stream",
-                    edge_tol=50,  # Tolerance for table edges
-                    row_tol=2,  # Tolerance for row detection
+            except Exception as exc:
+                LOGGER.warning(f"Camelot lattice extraction failed: {exc}")
+                complete = False
+
+        if flavor in ("stream", "both"):
+            stream_pages = text_pages
+            if flavor == "both":
+                needed = set(
+                    self._pages_needing_stream(handler, lattice_tables, pages)
                 )
+                stream_pages = [page for page in stream_pages if page in needed]
 
-            for idx, table in enumerate(camelot_tables):
-                # Skip low-accuracy tables
-                if table.accuracy < self.min_accuracy:
-                    LOGGER.debug(
-                        f"Skipping low-accuracy table (accuracy: {table.accuracy:.1f}%)"
+            if stream_pages:
+                try:
+                    stream_tables = self._extract_with_flavor(
+                        handler, "stream", stream_pages
                     )
-                    continue
+                except Exception as exc:
+                    LOGGER.warning(f"Camelot stream extraction failed: {exc}")
+                    complete = False
 
-                table_data = self._convert_to_table_data(table, idx, flavor)
+        return lattice_tables, stream_tables, complete
 
-                # Calculate comprehensive quality score
-                quality_score = self._calculate_table_quality_score(table_data, table)
-                table_data.metadata["quality_score"] = quality_score
+    def _scan_pages(
+        self, handler: _SplitPDFHandler, pages: Optional[List[int]] = None
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Find pages worth handing to each Camelot flavor.
 
-                # Skip low-quality tables (likely text boxes misdetected as tables)
-                if quality_score < self.min_quality_score:
-                    LOGGER.debug(
-                        f"Skipping low-quality table (quality: {quality_score:.2f}, "
-                        f"accuracy: {table.accuracy:.1f}%, shape: {table_data.dataframe.shape})"
-                    )
-                    continue
+        Lattice detects tables from ruling lines, so pages without at least
+        ``min_ruling_lines`` horizontal and vertical line segments cannot
+        yield lattice tables. Stream works from text, so pages without any
+        text cannot yield stream tables.
 
-                tables.append(table_data)
+        Args:
+            handler: Camelot PDF handler for the document and page range
+            pages: Subset of the handler's pages (1-indexed); all if None
+
+        Returns:
+            Tuple of (pages with ruling lines, pages with text), 1-indexed
+        """
+        if pages is None:
+            pages = handler.pages
 
+        ruled_pages = []
+        text_pages = []
+
+        try:
+            doc = handler.fitz_document()
         except Exception as exc:
-            LOGGER.warning(f"Camelot {flavor} extraction failed: {exc}")
+            LOGGER.debug(f"Page pre-scan failed, scanning all pages: {exc}")
+            return list(pages), list(pages)
+
+        for page_num in pages:
+            page = doc[page_num - 1]
+
+            horizontal = vertical = 0
+            for drawing in page.get_drawings():
+                for item in drawing["items"]:
+                    if item[0] == "l":
+                        start, end = item[1], item[2]
+                        horizontal += abs(start.y - end.y) < 1
+                        vertical += abs(start.x - end.x) < 1
+                    elif item[0] == "re":
+                        rect = item[1]
+                        # Thin filled rectangles are drawn as rules
+                        if rect.height <= 2:
+                            horizontal += 1
+                        elif rect.width <= 2:
+                            vertical += 1
+                        else:
+                            horizontal += 2
+                            vertical += 2
+
+            if min(horizontal, vertical) >= self.min_ruling_lines:
+                ruled_pages.append(page_num)
+            if page.get_text("text").strip():
+                text_pages.append(page_num)
+
+        skipped = len(pages) - len(ruled_pages)
+        if skipped:
+            LOGGER.debug(
+                f"Skipping lattice extraction on {skipped} pages without ruling lines"
+            )
+
+        return ruled_pages, text_pages
+
+    def _pages_needing_stream(
+        self,
+        handler: _SplitPDFHandler,
+        lattice_tables: List[TableData],
+        pages: Optional[List[int]] = None,
+    ) -> List[int]:
+        """
+        Select pages that still need a stream pass after lattice extraction.
+
+        A page is skipped when high-accuracy lattice tables already cover
+        most of it, since any stream table there would be discarded as an
+        overlap anyway.
+
+        Args:
+            handler: Camelot PDF handler for the document and page range
+            lattice_tables: Tables accepted from the lattice pass
+            pages: Subset of the handler's pages (1-indexed); all if None
+
+        Returns:
+            1-indexed page numbers to parse with stream
+        """
+        covered_area: Dict[int, float] = defaultdict(float)
+        for table in lattice_tables:
+            if table.metadata.get("accuracy", 0) > self.stream_skip_accuracy:
+                covered_area[table.bbox.page + 1] += table.bbox.area
+
+        skipped = set()
+        for page, area in covered_area.items():
+            page_area = handler.page_area(page)
+            if page_area > 0 and area / page_area > self.stream_skip_coverage:
+                skipped.add(page)
+
+        if skipped:
+            LOGGER.debug(
+                f"Skipping stream extraction on pages {sorted(skipped)} "
+                f"covered by lattice tables"
+            )
+
+        if pages is None:
+            pages = handler.pages
+        return [page for page in pages if page not in skipped]
+
+    def _extract_with_flavor(
+        self,
+        handler: PDFHandler,
+        flavor: str,
+        pages: Optional[List[int]] = None,
+    ) -> List[TableData]:
+        """
+        Extract tables using specified Camelot flavor.
+
+        Args:
+            handler: Camelot PDF handler for the document and page range
+            flavor: Camelot flavor ('lattice' or 'stream')
+            pages: Subset of the handler's pages (1-indexed); all if None
+
+        Returns:
+            List of TableData objects
+
+        Raises:
+            Exception: Whatever Camelot raised if the pass failed
+        """
+        tables = []
+
+        if flavor == "lattice":
+            camelot_tables = handler.parse(
+                flavor="lattice",
+                pages=pages,
+                line_scale=40,  # Sensitivity for detecting lines
+                copy_text=["v"],  # Vertical text handling
+            )
+        else:  # stream
+            camelot_tables = handler.parse(
+                flavor="stream",
+                pages=pages,
+                edge_tol=50,  # Tolerance for table edges
+                row_tol=2,  # Tolerance for row detection
+            )
+
+        for idx, table in enumerate(camelot_tables):
+            # Skip low-accuracy tables, including those whose accuracy
+            # alone rules out reaching min_quality_score
+            accuracy_score = (table.accuracy / 100) * 0.4
+            if (
+                table.accuracy < self.min_accuracy
+                or accuracy_score + 0.65 < self.min_quality_score
+            ):
+                LOGGER.debug(
+                    f"Skipping low-accuracy table (accuracy: {table.accuracy:.1f}%)"
+                )
+                continue
+
+            table_data = self._convert_to_table_data(table, idx, flavor)
+            table.df = None  # Cleaned copy lives on in table_data
+
+            # Accuracy plus the 2x2 structure points already clear the
+            # threshold, so the full score cannot reject the table
+            rows, cols = table_data.dataframe.shape
+            if (
+                rows >= 2
+                and cols >= 2
+                and accuracy_score + 0.3 >= self.min_quality_score
+            ):
+                table_data.metadata["quality_score"] = None
+                tables.append(table_data)
+                continue
+
+            # Calculate comprehensive quality score
+            quality_score = self._calculate_table_quality_score(table_data, table)
+            table_data.metadata["quality_score"] = quality_score
+
+            # Skip low-quality tables (likely text boxes misdetected as tables)
+            if quality_score < self.min_quality_score:
+                LOGGER.debug(
+                    f"Skipping low-quality table (quality: {quality_score:.2f}, "
+                    f"accuracy: {table.accuracy:.1f}%, shape: {table_data.dataframe.shape})"
+                )
+                continue
+
+            tables.append(table_data)
 
         return tables
 
@@ -144,19 +930,21 @@ class TableExtractor:
         Returns:
             TableData object
         """
-        # Get DataFrame and clean it
-        df = camelot_table.df.copy()
-        df = self._clean_dataframe(df)
-
-        # Extract bounding box (Camelot uses different coordinate system)
-        x0, y0, x1, y1 = camelot_table._bbox
+        # Read everything needed from the Camelot table up front
+        x0, y0, x1, y1 = camelot_table._bbox  # Camelot uses different coordinate system
         page_num = camelot_table.page - 1  # Camelot uses 1-indexed pages
+        accuracy = camelot_table.accuracy
+        whitespace = camelot_table.whitespace
+        raw_df = camelot_table.df
+
+        # Get DataFrame and clean it (cleaning never mutates its input)
+        df = self._clean_dataframe(raw_df)
 
         bbox = BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1, page=page_num)
 
         metadata = {
-            "accuracy": camelot_table.accuracy,
-            "whitespace": camelot_table.whitespace,
+            "accuracy": accuracy,
+            "whitespace": whitespace,
             "flavor": flavor,
             "table_index": table_index,
         }
@@ -175,35 +963,23 @@ class TableExtractor:
         Returns:
             Cleaned DataFrame
         """
-        # Remove completely empty rows and columns
+        # Remove completely empty rows and columns. dropna always returns a
+        # new frame, so relabelling columns below leaves the caller's intact
         df = df.dropna(how="all").dropna(axis=1, how="all")
 
-        # Try to detect if first row is a header
+        # Try to detect if first row is a header: headers typically have
+        # text in most cells
         if len(df) > 0:
             first_row = df.iloc[0]
-            if self._is_header_row(first_row):
+            if first_row.notna().mean() > 0.5:
                 df.columns = first_row.values
                 df = df.iloc[1:].reset_index(drop=True)
 
-        # Clean cell values
-        df = df.map(lambda x: str(x).strip() if pd.notna(x) else "")
+        # Clean cell values (column-wise string ops instead of a per-cell callback)
+        df = df.fillna("").astype(str).apply(lambda col: col.str.strip())
 
         return df
 
-    def _is_header_row(self, row: pd.Series) -> bool:
-        """
-        Detect if a row is likely a header.
-
-        Args:
-            row: DataFrame row
-
-        Returns:
-            True if row appears to be a header
-        """
-        # Headers typically have text in most cells
-        non_empty_ratio = row.notna().sum() / len(row)
-        return non_empty_ratio > 0.5
-
     def _calculate_table_quality_score(
         self, table_data: TableData, camelot_table
     ) -> float:
@@ -246,25 +1022,24 @@ class TableExtractor:
             # Partial credit for 1xN or Nx1 tables
             score += 0.1
 
-        # Factor 3: Content diversity (20%)
-        # Text boxes often have repeated values or single long text
+        # Factors 3 and 4 share one hashing pass over the flat cells: each
+        # distinct value is parsed as a number once, then counted per cell
         total_cells = rows * cols
+        codes, uniques = pd.factorize(df.to_numpy().ravel())
+        unique_values = len(uniques)
+        is_numeric = pd.notna(pd.to_numeric(uniques, errors="coerce"))
+        numeric_cells = int(is_numeric[codes].sum())
+
         if total_cells > 0:
-            unique_values = df.stack().nunique()
+            # Factor 3: Content diversity (20%)
+            # Text boxes often have repeated values or single long text
             diversity_ratio = unique_values / total_cells
             # High diversity = likely a real table
             diversity_score = min(diversity_ratio, 1.0) * 0.2
             score += diversity_score
 
-        # Factor 4: Numeric content (10%)
-        # Tables often contain numbers (vs pure text in text boxes)
-        numeric_cells = 0
-        for col in df.columns:
-            numeric_cells += df[col].apply(
-                lambda x: bool(pd.to_numeric(x, errors='coerce') is not pd.NA)
-            ).sum()
-
-        if total_cells > 0:
+            # Factor 4: Numeric content (10%)
+            # Tables often contain numbers (vs pure text in text boxes)
             numeric_ratio = numeric_cells / total_cells
             numeric_score = numeric_ratio * 0.1
             score += numeric_score
@@ -290,50 +1065,39 @@ class TableExtractor:
         Returns:
             True if table overlaps with any existing table
         """
+        bbox = table.bbox
+        # Overlap must cover more than half of the table's own area
+        min_overlap = bbox.area * 0.5
+        if min_overlap <= 0:
+            return False
+
+        # The table's coordinates are hoisted out of the loop; conditional
+        # expressions avoid the generic min()/max() builtins
+        page, x0, y0, x1, y1 = bbox.page, bbox.x0, bbox.y0, bbox.x1, bbox.y1
         for existing in existing_tables:
-            if table.bbox.overlaps(existing.bbox):
-                # Check overlap percentage
-                overlap_area = self._calculate_overlap_area(
-                    table.bbox, existing.bbox
-                )
-                table_area = table.bbox.width * table.bbox.height
-
-                if table_area > 0 and overlap_area / table_area > 0.5:
-                    return True
+            other = existing.bbox
+            # Cheap vertical rejection before the full overlap test
+            if y1 < other.y0 or y0 > other.y1 or other.page != page:
+                continue
+
+            x_overlap = (x1 if x1 < other.x1 else other.x1) - (
+                x0 if x0 > other.x0 else other.x0
+            )
+            y_overlap = (y1 if y1 < other.y1 else other.y1) - (
+                y0 if y0 > other.y0 else other.y0
+            )
+            if x_overlap > 0 and y_overlap > 0 and x_overlap * y_overlap > min_overlap:
+                return True
 
         return False
 
-    def _calculate_overlap_area(
-        self, bbox1: BoundingBox, bbox2: BoundingBox
-    ) -> float:
-        """
-        Calculate overlapping area between two bounding boxes.
-
-        Args:
-            bbox1: First bounding box
-            bbox2: Second bounding box
-
-        Returns:
-            Overlap area
-        """
-        if bbox1.page != bbox2.page:
-            return 0.0
-
-        x_overlap = max(
-            0, min(bbox1.x1, bbox2.x1) - max(bbox1.x0, bbox2.x0)
-        )
-        y_overlap = max(
-            0, min(bbox1.y1, bbox2.y1) - max(bbox1.y0, bbox2.y0)
-        )
-
-        return x_overlap * y_overlap
-
     def extract_table_at_region(
         self,
         pdf_path: Path,
         page: int,
         bbox: BoundingBox,
         flavor: str = "lattice",
+        handler: Optional[_SplitPDFHandler] = None,
     ) -> Optional[TableData]:
         """
         Extract table at specific region.
@@ -343,31 +1107,31 @@ class TableExtractor:
             page: Page number (0-indexed)
             bbox: Bounding box of table region
             flavor: Camelot flavor to use
+            handler: Handler from open() to reuse across regions; without
+                one, a handler for just this page is opened for the call
 
         Returns:
             TableData if successful, None otherwise
         """
         try:
-            # Camelot uses 1-indexed pages
-            page_str = str(page + 1)
-
             # Camelot table_areas format: ["x1,y1,x2,y2"]
-            table_area = f"{bbox.x0},{bbox.y1},{bbox.x1},{bbox.y0}"
-
+            table_area = bbox.camelot_area
             if flavor == "lattice":
-                tables = camelot.read_pdf(
-                    str(pdf_path),
-                    pages=page_str,
-                    flavor="lattice",
-                    table_areas=[table_area],
-                )
+                region_kwargs = {"table_areas": [table_area]}
             else:
-                tables = camelot.read_pdf(
-                    str(pdf_path),
-                    pages=page_str,
-                    flavor="stream",
-                    table_regions=[table_area],
+                region_kwargs = {"table_regions": [table_area]}
+
+            # Camelot uses 1-indexed pages. The handler renders lattice pages
+            # with PyMuPDF, where camelot.read_pdf would need Ghostscript
+            if handler is not None:
+                tables = handler.parse(
+                    flavor=flavor, pages=[page + 1], **region_kwargs
                 )
+            else:
+                with _SplitPDFHandler(str(pdf_path), pages=str(page + 1)) as handler:
+                    tables = handler.parse(
+                        flavor=flavor, pages=[page + 1], **region_kwargs
+                    )
 
             if tables and len(tables) > 0:
                 return self._convert_to_table_data(tables[0], 0, flavor)
@@ -0,0 +1,75 @@
+"""Tests for pdfplumber-based hierarchy parser."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from src.models.document_structure import BoundingBox
+from src.parsers.hierarchy_parser import HierarchyParser
+
+
+@pytest.fixture
+def sample_pdf_path(tmp_path: Path) -> Path:
+    """Create a small three-page PDF on disk."""
+    pdf_file = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_num in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{page_num + 1}. Section")
+        page.insert_text((90, 300), f"Body text {page_num + 1}")
+    doc.save(str(pdf_file))
+    doc.close()
+    return pdf_file
+
+
+class TestHierarchyParser:
+    """Test suite for HierarchyParser."""
+
+    def test_extract_text_blocks_in_chunks(self, sample_pdf_path: Path) -> None:
+        """Test that chunked extraction returns the same blocks in page order."""
+        sequential = HierarchyParser(max_workers=1).extract_text_blocks(
+            sample_pdf_path
+        )
+
+        with patch(
+            "src.parsers.hierarchy_parser.ProcessPoolExecutor",
+            lambda max_workers, mp_context=None: ThreadPoolExecutor(max_workers),
+        ):
+            chunked = HierarchyParser(
+                max_workers=2, pages_per_chunk=1
+            ).extract_text_blocks(sample_pdf_path)
+
+        assert [(block.bbox.page, block.text) for block in chunked] == [
+            (block.bbox.page, block.text) for block in sequential
+        ]
+        assert [block.bbox.page for block in chunked] == [0, 0, 1, 1, 2, 2]
+
+    def test_parse_with_precomputed_text_blocks(self, sample_pdf_path: Path) -> None:
+        """Test that parse filters and structures pre-extracted text blocks."""
+        parser = HierarchyParser(max_workers=1)
+        text_blocks = parser.extract_text_blocks(sample_pdf_path)
+        body = text_blocks[1].bbox
+
+        with patch.object(parser, "extract_text_blocks") as mock_extract:
+            sections = parser.parse(
+                sample_pdf_path,
+                exclude_regions=[
+                    BoundingBox(
+                        x0=body.x0, y0=body.y0, x1=body.x1, y1=body.y1, page=0
+                    )
+                ],
+                text_blocks=text_blocks,
+            )
+
+        mock_extract.assert_not_called()
+        assert [section.title for section in sections] == [
+            "1. Section",
+            "2. Section",
+            "3. Section",
+        ]
+        assert sections[0].content == []
+        assert sections[1].content == ["Body text 2"]
@@ -0,0 +1,40 @@
+"""Tests for PyMuPDF layout analyzer."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.parsers.layout_analyzer import LayoutAnalyzer
+
+
+@pytest.fixture
+def sample_pdf_path(tmp_path: Path) -> Path:
+    """Create a small three-page PDF on disk."""
+    pdf_file = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_num in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{page_num + 1}. Section")
+    doc.save(str(pdf_file))
+    doc.close()
+    return pdf_file
+
+
+class TestLayoutAnalyzer:
+    """Test suite for LayoutAnalyzer."""
+
+    def test_iter_pages_yields_each_page(self, sample_pdf_path: Path) -> None:
+        """Test that pages are yielded in order with their layout."""
+        pages = list(LayoutAnalyzer().iter_pages(sample_pdf_path))
+
+        assert [page_num for page_num, _ in pages] == [0, 1, 2]
+        assert pages[1][1]["text_blocks"][0].text == "2. Section"
+
+    def test_analyze_matches_iter_pages(self, sample_pdf_path: Path) -> None:
+        """Test that analyze collects the streamed pages into a dict."""
+        layout_info = LayoutAnalyzer().analyze(sample_pdf_path)
+
+        assert sorted(layout_info) == [0, 1, 2]
+        assert layout_info[0]["page_num"] == 0
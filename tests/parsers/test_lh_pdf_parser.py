@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pandas as pd
 import pytest
@@ -40,6 +40,16 @@ class TestLHPDFParser:
         assert parser.table_extractor is not None
         assert parser.hierarchy_parser is not None
 
+    def test_initialization_splits_worker_budget(self) -> None:
+        """Test that concurrent stages share one worker budget."""
+        parallel = LHPDFParser(max_workers=8)
+        assert parallel.table_extractor.max_workers == 6
+        assert parallel.hierarchy_parser.max_workers == 2
+
+        sequential = LHPDFParser(parallel=False, max_workers=8)
+        assert sequential.table_extractor.max_workers == 8
+        assert sequential.hierarchy_parser.max_workers == 8
+
     def test_validate_pdf_nonexistent(
         self, parser: LHPDFParser, tmp_path: Path
     ) -> None:
@@ -55,27 +65,39 @@ class TestLHPDFParser:
         wrong_file.touch()
         assert parser.validate_pdf(wrong_file) is False
 
-    @patch("src.parsers.lh_pdf_parser.LayoutAnalyzer")
-    @patch("src.parsers.lh_pdf_parser.TableExtractor")
-    @patch("src.parsers.lh_pdf_parser.HierarchyParser")
+    def test_validate_pdf_valid(
+        self, parser: LHPDFParser, tmp_path: Path
+    ) -> None:
+        """Test PDF validation with a well-formed PDF."""
+        pdf_file = tmp_path / "valid.pdf"
+        pdf_file.write_bytes(b"%PDF-1.7\n" + b"0" * 2048 + b"\n%%EOF\n")
+        assert parser.validate_pdf(pdf_file) is True
+
+    def test_validate_pdf_bad_header(
+        self, parser: LHPDFParser, tmp_path: Path
+    ) -> None:
+        """Test PDF validation with a .pdf file that is not a PDF."""
+        fake_pdf = tmp_path / "fake.pdf"
+        fake_pdf.write_bytes(b"<html></html>")
+        assert parser.validate_pdf(fake_pdf) is False
+
     def test_parse_integration(
-        self,
-        mock_hierarchy_parser: Mock,
-        mock_table_extractor: Mock,
-        mock_layout_analyzer: Mock,
-        parser: LHPDFParser,
-        sample_pdf_path: Path,
+        self, parser: LHPDFParser, sample_pdf_path: Path
     ) -> None:
         """Test full PDF parsing integration."""
-        # Setup mocks
-        mock_layout_analyzer.return_value.analyze.return_value = {
-            0: {
-                "text_blocks": [],
-                "table_regions": [
-                    BoundingBox(x0=100, y0=200, x1=400, y1=300, page=0)
-                ],
-            }
-        }
+        # Replace the sub-parsers with mocks
+        parser.layout_analyzer = Mock()
+        parser.layout_analyzer.iter_pages.return_value = iter([
+            (
+                0,
+                {
+                    "text_blocks": [],
+                    "table_regions": [
+                        BoundingBox(x0=100, y0=200, x1=400, y1=300, page=0)
+                    ],
+                },
+            )
+        ])
 
         mock_table = TableData(
             dataframe=pd.DataFrame({"col1": ["a", "b"], "col2": ["c", "d"]}),
@@ -83,9 +105,8 @@ class TestLHPDFParser:
             page=0,
             metadata={},
         )
-        mock_table_extractor.return_value.extract_tables.return_value = [
-            mock_table
-        ]
+        parser.table_extractor = Mock()
+        parser.table_extractor.extract_tables.return_value = [mock_table]
 
         mock_section = Section(
             level=1,
@@ -93,16 +114,12 @@ class TestLHPDFParser:
             bbox=BoundingBox(x0=100, y0=100, x1=400, y1=150, page=0),
             content=["Test content"],
         )
-        mock_hierarchy_parser.return_value.parse.return_value = [mock_section]
+        parser.hierarchy_parser = Mock()
+        parser.hierarchy_parser.parse.return_value = [mock_section]
 
         # Create actual file
         sample_pdf_path.touch()
 
-        # Re-create parser with mocked components
-        parser.layout_analyzer = mock_layout_analyzer.return_value
-        parser.table_extractor = mock_table_extractor.return_value
-        parser.hierarchy_parser = mock_hierarchy_parser.return_value
-
         # Execute parse
         document = parser.parse(sample_pdf_path)
 
@@ -111,8 +128,51 @@ class TestLHPDFParser:
         assert len(document.sections) == 1
         assert document.sections[0].title == "1. Test Section"
         assert document.metadata["total_sections"] == 1
+        assert document.sections[0].tables == [mock_table]
         assert document.source_path == sample_pdf_path
 
+    def test_parse_sequential_matches_parallel(
+        self, sample_pdf_path: Path
+    ) -> None:
+        """Test that disabling stage concurrency yields the same document."""
+        documents = []
+        for parallel in (True, False):
+            parser = LHPDFParser(parallel=parallel)
+            parser.layout_analyzer = Mock()
+            parser.layout_analyzer.iter_pages.return_value = iter(
+                [(0, {"table_regions": []})]
+            )
+            parser.table_extractor = Mock()
+            parser.table_extractor.extract_tables.return_value = []
+            parser.hierarchy_parser = Mock()
+            parser.hierarchy_parser.parse.return_value = [
+                Section(level=1, title="1. 공급대상")
+            ]
+
+            documents.append(parser.parse(sample_pdf_path))
+
+        assert documents[0].to_dict() == documents[1].to_dict()
+
+    def test_parse_runs_layout_before_table_extraction(
+        self, parser: LHPDFParser, sample_pdf_path: Path
+    ) -> None:
+        """Test that the PyMuPDF stages never overlap on separate threads."""
+        calls = []
+        parser.layout_analyzer = Mock()
+        parser.layout_analyzer.iter_pages.side_effect = lambda path: (
+            calls.append("layout") or iter([(0, {"table_regions": []})])
+        )
+        parser.table_extractor = Mock()
+        parser.table_extractor.extract_tables.side_effect = lambda **kwargs: (
+            calls.append("tables") or []
+        )
+        parser.hierarchy_parser = Mock()
+        parser.hierarchy_parser.parse.return_value = []
+
+        parser.parse(sample_pdf_path)
+
+        assert calls == ["layout", "tables"]
+
     def test_merge_tables_into_sections(self, parser: LHPDFParser) -> None:
         """Test merging tables into sections."""
         section = Section(
@@ -133,6 +193,47 @@ class TestLHPDFParser:
         assert len(section.tables) == 1
         assert section.tables[0] == table
 
+    def test_merge_tables_into_sections_multiple_pages(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test page-ordered assignment of unsorted tables across pages."""
+        section1 = Section(
+            level=1,
+            title="Section 1",
+            bbox=BoundingBox(x0=100, y0=100, x1=400, y1=150, page=0),
+        )
+        section2 = Section(
+            level=1,
+            title="Section 2",
+            bbox=BoundingBox(x0=100, y0=100, x1=400, y1=150, page=1),
+        )
+        orphan_page_table = TableData(
+            dataframe=pd.DataFrame({"col1": ["a"]}),
+            bbox=BoundingBox(x0=100, y0=200, x1=400, y1=300, page=2),
+            page=2,
+            metadata={},
+        )
+        page1_table = TableData(
+            dataframe=pd.DataFrame({"col1": ["b"]}),
+            bbox=BoundingBox(x0=100, y0=200, x1=400, y1=300, page=1),
+            page=1,
+            metadata={},
+        )
+        page0_table = TableData(
+            dataframe=pd.DataFrame({"col1": ["c"]}),
+            bbox=BoundingBox(x0=100, y0=200, x1=400, y1=300, page=0),
+            page=0,
+            metadata={},
+        )
+
+        parser._merge_tables_into_sections(
+            [section1, section2], [orphan_page_table, page1_table, page0_table]
+        )
+
+        # A table on a page without sections falls back to the full scan
+        assert section1.tables == [orphan_page_table, page0_table]
+        assert section2.tables == [page1_table]
+
     def test_find_best_section_for_table_same_page(
         self, parser: LHPDFParser
     ) -> None:
@@ -188,6 +289,106 @@ class TestLHPDFParser:
         # Should prefer child section (higher depth score)
         assert best == child_section
 
+    def test_find_best_section_for_table_skips_sections_without_bbox(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test that children of a section without bbox are still scored."""
+        child_section = Section(
+            level=2,
+            title="Child Section",
+            bbox=BoundingBox(x0=100, y0=150, x1=400, y1=180, page=0),
+        )
+
+        title_section = Section(
+            level=0, title="Document Title", children=[child_section]
+        )
+
+        table = TableData(
+            dataframe=pd.DataFrame({"col1": ["a"]}),
+            bbox=BoundingBox(x0=100, y0=200, x1=400, y1=300, page=0),
+            page=0,
+            metadata={},
+        )
+
+        best = parser._find_best_section_for_table([title_section], table)
+
+        assert best is child_section
+
+    def test_find_best_section_for_table_with_page_index(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test that a page index gives the same result as the full walk."""
+        section1 = Section(
+            level=1,
+            title="Section 1",
+            bbox=BoundingBox(x0=100, y0=100, x1=400, y1=150, page=0),
+        )
+        section2 = Section(
+            level=1,
+            title="Section 2",
+            bbox=BoundingBox(x0=100, y0=100, x1=400, y1=150, page=1),
+        )
+        sections = [section1, section2]
+        page_index = parser._build_page_index(parser._flatten_sections(sections))
+
+        assert list(page_index) == [0, 1]
+
+        for page, expected in [(0, section1), (1, section2), (4, section1)]:
+            table = TableData(
+                dataframe=pd.DataFrame({"col1": ["a"]}),
+                bbox=BoundingBox(x0=100, y0=200, x1=400, y1=300, page=page),
+                page=page,
+                metadata={},
+            )
+
+            best = parser._find_best_section_for_table(
+                sections, table, page_index=page_index
+            )
+
+            assert best is expected
+            assert best is parser._find_best_section_for_table(sections, table)
+
+    def test_score_sections_vectorized_matches_scalar(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test that vectorized scoring picks the same section and score."""
+        sections = [
+            Section(
+                level=1,
+                title=f"Section {index}",
+                bbox=BoundingBox(
+                    x0=100, y0=40 * index, x1=400, y1=40 * index + 20, page=index % 3
+                ),
+                children=[
+                    Section(
+                        level=2,
+                        title=f"Child {index}",
+                        bbox=BoundingBox(
+                            x0=120, y0=40 * index + 20, x1=400, y1=40 * index + 30,
+                            page=index % 3,
+                        ),
+                    )
+                ],
+            )
+            for index in range(12)
+        ]
+        candidates = parser._flatten_sections(sections)
+        arrays = parser._section_arrays(candidates)
+
+        for page, y0 in [(0, 150), (1, 330), (2, 500), (5, 100)]:
+            table = TableData(
+                dataframe=pd.DataFrame({"col1": ["a"]}),
+                bbox=BoundingBox(x0=100, y0=y0, x1=400, y1=y0 + 80, page=page),
+                page=page,
+                metadata={},
+            )
+
+            scalar = parser._score_sections(candidates, table)
+            vectorized = parser._score_sections_vectorized(candidates, arrays, table)
+
+            assert vectorized[0] is scalar[0]
+            assert vectorized[1] == scalar[1]
+
     def test_can_merge_tables_consecutive_pages(
         self, parser: LHPDFParser
     ) -> None:
@@ -274,6 +475,55 @@ class TestLHPDFParser:
         assert merged.bbox.y1 == 150
         assert "merged_from_pages" in merged.metadata
 
+    def test_merge_two_tables_different_headers(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test that continuation rows are stacked by position, not by label."""
+        table1 = TableData(
+            dataframe=pd.DataFrame({"구분": ["a"], "호수": ["b"]}),
+            bbox=BoundingBox(x0=100, y0=500, x1=400, y1=700, page=0),
+            page=0,
+            metadata={},
+        )
+
+        table2 = TableData(
+            dataframe=pd.DataFrame({"행복주택": ["c"], "12": ["d"]}),
+            bbox=BoundingBox(x0=100, y0=50, x1=400, y1=150, page=1),
+            page=1,
+            metadata={},
+        )
+
+        merged = parser._merge_two_tables(table1, table2)
+
+        assert list(merged.dataframe.columns) == ["구분", "호수"]
+        assert list(merged.dataframe["구분"]) == ["a", "c"]
+        assert list(merged.dataframe["호수"]) == ["b", "d"]
+
+    def test_merge_two_tables_duplicate_columns(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test merging tables with duplicate labels leaves the inputs untouched."""
+        df1 = pd.DataFrame([["a", "b"]], columns=["", ""])
+        table1 = TableData(
+            dataframe=df1,
+            bbox=BoundingBox(x0=100, y0=500, x1=400, y1=700, page=0),
+            page=0,
+            metadata={},
+        )
+
+        table2 = TableData(
+            dataframe=pd.DataFrame([["c", "d"]], columns=["", ""]),
+            bbox=BoundingBox(x0=100, y0=50, x1=400, y1=150, page=1),
+            page=1,
+            metadata={},
+        )
+
+        merged = parser._merge_two_tables(table1, table2)
+
+        assert list(merged.dataframe.columns) == [0, 1]
+        assert list(merged.dataframe[0]) == ["a", "c"]
+        assert list(df1.columns) == ["", ""]
+
     def test_merge_cross_page_tables(self, parser: LHPDFParser) -> None:
         """Test cross-page table merging."""
         table1 = TableData(
@@ -304,6 +554,81 @@ class TestLHPDFParser:
         assert len(merged[0].dataframe) == 2  # Merged table
         assert len(merged[1].dataframe) == 1  # Separate table
 
+    def test_merge_cross_page_tables_three_page_run(
+        self, parser: LHPDFParser
+    ) -> None:
+        """Test that a table continuing over three pages merges into one."""
+        tables = [
+            TableData(
+                dataframe=pd.DataFrame({"col1": [f"r{page}"], "col2": ["x"]}),
+                bbox=BoundingBox(
+                    x0=100 + page, y0=500 if page == 0 else 50,
+                    x1=400, y1=700 if page == 0 else 150 + page, page=page,
+                ),
+                page=page,
+                metadata={},
+            )
+            for page in range(3)
+        ]
+
+        merged = parser._merge_cross_page_tables(tables)
+
+        assert len(merged) == 1
+        assert list(merged[0].dataframe["col1"]) == ["r0", "r1", "r2"]
+        assert merged[0].metadata["merged_from_pages"] == [0, 1, 2]
+        assert merged[0].bbox == BoundingBox(x0=100, y0=500, x1=400, y1=152, page=0)
+
+    def test_parse_stream(self, parser: LHPDFParser, sample_pdf_path: Path) -> None:
+        """Test page-by-page parsing with a table continuing across chunks."""
+        first = TableData(
+            dataframe=pd.DataFrame({"col1": ["a"], "col2": ["b"]}),
+            bbox=BoundingBox(x0=100, y0=500, x1=400, y1=700, page=0),
+            page=0,
+            metadata={},
+        )
+        continuation = TableData(
+            dataframe=pd.DataFrame({"col1": ["c"], "col2": ["d"]}),
+            bbox=BoundingBox(x0=100, y0=50, x1=400, y1=150, page=1),
+            page=1,
+            metadata={},
+        )
+        heading = TextBlock(
+            text="1. 신청자격",
+            bbox=BoundingBox(x0=100, y0=550, x1=300, y1=565, page=0),
+        )
+        table_text = TextBlock(
+            text="a b",
+            bbox=BoundingBox(x0=110, y0=600, x1=300, y1=615, page=0),
+        )
+        body = TextBlock(
+            text="Body text",
+            bbox=BoundingBox(x0=100, y0=300, x1=300, y1=315, page=2),
+        )
+
+        parser.table_extractor = Mock()
+        parser.table_extractor.iter_table_chunks.return_value = (
+            chunk for chunk in [([0], [first]), ([1, 2], [continuation])]
+        )
+        parser.hierarchy_parser.iter_text_blocks = Mock(return_value=iter([
+            (0, [heading, table_text]),
+            (1, []),
+            (2, [body]),
+        ]))
+
+        results = list(parser.parse_stream(sample_pdf_path))
+
+        assert [result.page for result in results] == [0, 1, 2]
+
+        # Table text is dropped, headings inside the table region are kept
+        assert results[0].text_blocks == [heading]
+        assert results[2].text_blocks == [body]
+
+        # The continuation is merged onto the page the table starts on
+        assert len(results[0].tables) == 1
+        assert list(results[0].tables[0].dataframe["col1"]) == ["a", "c"]
+        assert results[0].tables[0].metadata["merged_from_pages"] == [0, 1]
+        assert results[1].tables == []
+
     def test_count_all_sections(self, parser: LHPDFParser) -> None:
         """Test counting nested sections."""
         child1 = Section(level=2, title="Child 1")
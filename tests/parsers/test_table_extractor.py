@@ -0,0 +1,472 @@
+"""Tests for Camelot-based table extractor."""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import fitz
+import numpy as np
+import pandas as pd
+import pytest
+from pypdf import PdfReader
+
+from src.models.document_structure import BoundingBox, TableData
+from src.parsers.table_extractor import (
+    TableExtractor,
+    _PyMuPDFBackend,
+    _SplitPDFHandler,
+)
+
+
+def _make_table(x0: float, y0: float, x1: float, y1: float, page: int) -> TableData:
+    """Create a minimal TableData at the given position."""
+    return TableData(
+        dataframe=pd.DataFrame({"col1": ["a"], "col2": ["b"]}),
+        bbox=BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1, page=page),
+        page=page,
+        metadata={},
+    )
+
+
+@pytest.fixture
+def extractor() -> TableExtractor:
+    """Create table extractor instance."""
+    return TableExtractor()
+
+
+@pytest.fixture
+def sample_pdf_path(tmp_path: Path) -> Path:
+    """Create a small two-page PDF on disk, each page with a ruled 2x2 grid."""
+    pdf_file = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_num in range(2):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num + 1}")
+        for offset in (0, 50, 100):
+            page.draw_line((72, 100 + offset), (272, 100 + offset))
+            page.draw_line((72 + 2 * offset, 100), (72 + 2 * offset, 200))
+    doc.save(str(pdf_file))
+    doc.close()
+    return pdf_file
+
+
+class TestTableExtractor:
+    """Test suite for TableExtractor."""
+
+    def test_clean_dataframe_strips_cells(self, extractor: TableExtractor) -> None:
+        """Test that cell values are stripped and missing values become empty."""
+        df = pd.DataFrame(
+            [
+                ["구분", "주택형", "호수"],
+                [" 행복주택 ", np.nan, " 12 "],
+                ["국민임대", " 46A", "3"],
+            ]
+        )
+
+        cleaned = extractor._clean_dataframe(df)
+
+        assert list(cleaned.columns) == ["구분", "주택형", "호수"]
+        assert list(cleaned["구분"]) == ["행복주택", "국민임대"]
+        assert list(cleaned["주택형"]) == ["", "46A"]
+        assert list(cleaned["호수"]) == ["12", "3"]
+        assert list(df.columns) == [0, 1, 2]  # Input left untouched
+        assert df.iloc[1, 0] == " 행복주택 "
+
+    def test_clean_dataframe_duplicate_headers(
+        self, extractor: TableExtractor
+    ) -> None:
+        """Test cleaning when the detected header row has duplicate labels."""
+        df = pd.DataFrame([["구분", "구분"], [" a ", "b "]])
+
+        cleaned = extractor._clean_dataframe(df)
+
+        assert cleaned.shape == (1, 2)
+        assert cleaned.iloc[0].tolist() == ["a", "b"]
+
+    def test_extract_tables_both_skips_overlapping_stream(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that stream tables overlapping lattice tables on the same page are dropped."""
+        lattice = [_make_table(100, 100, 400, 300, page=0)]
+        stream = [
+            _make_table(110, 110, 390, 290, page=0),  # Duplicate of lattice table
+            _make_table(110, 110, 390, 290, page=1),  # Same area, other page
+            _make_table(100, 400, 400, 500, page=0),  # Below lattice table
+        ]
+
+        def fake_extract(handler, flavor: str, pages=None):
+            return lattice if flavor == "lattice" else stream
+
+        with patch.object(extractor, "_extract_with_flavor", side_effect=fake_extract):
+            tables = extractor.extract_tables(sample_pdf_path, flavor="both")
+
+        assert tables == [lattice[0], stream[1], stream[2]]
+
+    def test_extract_tables_skips_stream_on_covered_pages(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that pages covered by accurate lattice tables skip stream."""
+        full_page = _make_table(0, 0, 595, 842, page=0)
+        full_page.metadata["accuracy"] = 99.0
+        stream_pages = []
+
+        def fake_extract(handler, flavor: str, pages=None):
+            if flavor == "lattice":
+                return [full_page]
+            stream_pages.append(pages)
+            return []
+
+        with patch.object(extractor, "_extract_with_flavor", side_effect=fake_extract):
+            tables = extractor.extract_tables(sample_pdf_path, flavor="both")
+
+        assert tables == [full_page]
+        assert stream_pages == [[2]]
+
+    def test_extract_tables_splits_pdf_once_for_both_flavors(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that lattice and stream passes share one split of the PDF."""
+        with patch(
+            "src.parsers.table_extractor._SplitPDFHandler._save_page",
+            autospec=True,
+        ) as mock_save_page, patch(
+            "src.parsers.table_extractor.Lattice"
+        ) as mock_lattice, patch(
+            "src.parsers.table_extractor.Stream"
+        ) as mock_stream:
+            mock_lattice.return_value.extract_tables.return_value = []
+            mock_stream.return_value.extract_tables.return_value = []
+
+            extractor.extract_tables(sample_pdf_path, flavor="both")
+
+        assert mock_save_page.call_count == 2  # Once per page, not per flavor
+        assert mock_lattice.return_value.extract_tables.call_count == 2
+        assert mock_stream.return_value.extract_tables.call_count == 2
+
+    def test_extract_tables_uses_cache(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ) -> None:
+        """Test that repeated calls on the same PDF are served from the cache."""
+        extractor = TableExtractor(cache_dir=tmp_path / "cache")
+        lattice = [_make_table(100, 100, 400, 300, page=0)]
+
+        def fake_extract(handler, flavor: str, pages=None):
+            return lattice if flavor == "lattice" else []
+
+        with patch.object(
+            extractor, "_extract_with_flavor", side_effect=fake_extract
+        ) as mock_extract:
+            first = extractor.extract_tables(sample_pdf_path, flavor="both")
+            second = extractor.extract_tables(sample_pdf_path, flavor="both")
+            extractor.extract_tables(sample_pdf_path, flavor="lattice")
+
+        assert mock_extract.call_count == 3  # lattice+stream, then lattice only
+        assert [table.bbox for table in second] == [table.bbox for table in first]
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 2
+
+    def test_extract_tables_does_not_cache_failures(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ) -> None:
+        """Test that a failed Camelot pass is not cached as a table-free PDF."""
+        extractor = TableExtractor(cache_dir=tmp_path / "cache")
+        lattice = [_make_table(100, 100, 400, 300, page=0)]
+
+        with patch.object(
+            extractor, "_extract_with_flavor", side_effect=RuntimeError("boom")
+        ):
+            assert extractor.extract_tables(sample_pdf_path, flavor="both") == []
+
+        assert not list((tmp_path / "cache").glob("*.pkl"))
+
+        with patch.object(
+            extractor, "_extract_with_flavor", return_value=lattice
+        ) as mock_extract:
+            tables = extractor.extract_tables(sample_pdf_path, flavor="lattice")
+
+        assert mock_extract.call_count == 1
+        assert [table.bbox for table in tables] == [lattice[0].bbox]
+
+    def test_extract_tables_parallel_chunks(self, sample_pdf_path: Path) -> None:
+        """Test that page chunks are extracted separately and merged in order."""
+        extractor = TableExtractor(max_workers=2, pages_per_chunk=1)
+        lattice_p1 = _make_table(100, 100, 400, 300, page=0)
+        stream_p1 = _make_table(100, 400, 400, 500, page=0)
+        stream_p2 = _make_table(110, 110, 390, 290, page=1)
+        results = {
+            "1": ([lattice_p1], [stream_p1], True),
+            "2": ([], [stream_p2], True),
+        }
+
+        def fake_chunk(pdf_path, pages: str, flavor: str):
+            return results[pages]
+
+        with patch(
+            "src.parsers.table_extractor.ProcessPoolExecutor",
+            lambda max_workers, mp_context=None: ThreadPoolExecutor(max_workers),
+        ), patch.object(extractor, "_extract_chunk", side_effect=fake_chunk) as mock_chunk:
+            tables = extractor.extract_tables(sample_pdf_path, flavor="both")
+
+        assert mock_chunk.call_count == 2
+        assert tables == [lattice_p1, stream_p1, stream_p2]
+
+    def test_extract_tables_streaming_spills_chunks(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ) -> None:
+        """Test that streamed tables round-trip through the per-chunk spill files."""
+        extractor = TableExtractor(max_workers=1, pages_per_chunk=1)
+        lattice_p1 = _make_table(100, 100, 400, 300, page=0)
+        overlapping_p1 = _make_table(110, 110, 390, 290, page=0)
+        stream_p2 = _make_table(110, 110, 390, 290, page=1)
+        results = {
+            "1": ([lattice_p1], [overlapping_p1], True),
+            "2": ([], [stream_p2], True),
+        }
+
+        def fake_chunk(pdf_path, pages: str, flavor: str):
+            return results[pages]
+
+        spill_dir = tmp_path / "spill"
+        spill_dir.mkdir()
+        with patch.object(extractor, "_extract_chunk", side_effect=fake_chunk), patch(
+            "src.parsers.table_extractor.tempfile.mkdtemp", return_value=str(spill_dir)
+        ):
+            tables = list(
+                extractor.extract_tables_streaming(sample_pdf_path, flavor="both")
+            )
+
+        assert [table.bbox for table in tables] == [lattice_p1.bbox, stream_p2.bbox]
+        assert tables[0].dataframe.equals(lattice_p1.dataframe)
+        assert not spill_dir.exists()
+
+    def test_iter_table_chunks_yields_before_later_chunks(
+        self, sample_pdf_path: Path
+    ) -> None:
+        """Test that each chunk is yielded before the next one is extracted."""
+        extractor = TableExtractor(max_workers=1, pages_per_chunk=1)
+
+        with patch.object(
+            extractor, "_extract_chunk", return_value=([], [], True)
+        ) as mock_chunk:
+            chunks = extractor.iter_table_chunks(sample_pdf_path, flavor="both")
+            assert next(chunks) == ([0], [])
+            assert mock_chunk.call_count == 1
+            chunks.close()
+
+    def test_scan_pages_separates_ruled_and_text_pages(
+        self, extractor: TableExtractor, tmp_path: Path
+    ) -> None:
+        """Test that the pre-scan routes pages by ruling lines and text."""
+        pdf_file = tmp_path / "mixed.pdf"
+        doc = fitz.open()
+        doc.new_page().insert_text((72, 72), "Prose only")
+        grid_page = doc.new_page()
+        for offset in (0, 50, 100):
+            grid_page.draw_line((72, 100 + offset), (272, 100 + offset))
+            grid_page.draw_line((72 + 2 * offset, 100), (72 + 2 * offset, 200))
+        doc.new_page()  # Blank
+        doc.save(str(pdf_file))
+        doc.close()
+
+        with _SplitPDFHandler(str(pdf_file), pages="all") as handler:
+            ruled_pages, text_pages = extractor._scan_pages(handler)
+
+        assert ruled_pages == [2]
+        assert text_pages == [1]
+
+    def test_convert_to_table_data(self, extractor: TableExtractor) -> None:
+        """Test conversion of a Camelot table into TableData."""
+        camelot_table = SimpleNamespace(
+            df=pd.DataFrame([["구분", "호수"], ["행복주택 ", "12"]]),
+            _bbox=(72.0, 600.0, 432.0, 760.0),
+            page=3,
+            accuracy=98.5,
+            whitespace=12.0,
+        )
+
+        table_data = extractor._convert_to_table_data(camelot_table, 2, "lattice")
+
+        assert table_data.page == 2
+        assert table_data.bbox == BoundingBox(
+            x0=72.0, y0=600.0, x1=432.0, y1=760.0, page=2
+        )
+        assert table_data.metadata == {
+            "accuracy": 98.5,
+            "whitespace": 12.0,
+            "flavor": "lattice",
+            "table_index": 2,
+        }
+        assert list(table_data.dataframe["구분"]) == ["행복주택"]
+
+    def test_quality_score_counts_numeric_cells(
+        self, extractor: TableExtractor
+    ) -> None:
+        """Test that only numeric cells contribute to the numeric factor."""
+        table = _make_table(0, 0, 100, 100, page=0)
+        table.dataframe = pd.DataFrame({"구분": ["행복주택", "국민임대"], "호수": ["12", "3"]})
+        camelot_table = SimpleNamespace(accuracy=100.0)
+
+        score = extractor._calculate_table_quality_score(table, camelot_table)
+
+        # accuracy 0.4 + structure 0.3 + size 0.008 + diversity 0.2 + numeric 0.05
+        assert score == pytest.approx(0.958)
+
+    def test_quality_score_empty_table(self, extractor: TableExtractor) -> None:
+        """Test that an empty table scores on accuracy alone."""
+        table = _make_table(0, 0, 100, 100, page=0)
+        table.dataframe = pd.DataFrame()
+
+        score = extractor._calculate_table_quality_score(
+            table, SimpleNamespace(accuracy=50.0)
+        )
+
+        assert score == pytest.approx(0.2)
+
+    def test_extract_with_flavor_skips_scoring_when_decided(
+        self, extractor: TableExtractor
+    ) -> None:
+        """Test that quality scoring only runs when accuracy cannot decide."""
+        extractor.min_quality_score = 0.6
+
+        def camelot_table(accuracy: float, rows: list) -> SimpleNamespace:
+            return SimpleNamespace(
+                df=pd.DataFrame(rows), _bbox=(0, 0, 100, 100), page=1,
+                accuracy=accuracy, whitespace=0.0,
+            )
+
+        grid = [["구분", "호수"], ["행복주택", "12"], ["국민임대", "3"]]
+        handler = SimpleNamespace(
+            parse=lambda **kwargs: [
+                camelot_table(80.0, grid),  # 0.32 + 0.3 >= 0.6: guaranteed pass
+                camelot_table(60.0, grid),  # Undecided: scored
+            ]
+        )
+
+        with patch.object(
+            extractor, "_calculate_table_quality_score", return_value=0.7
+        ) as mock_score:
+            tables = extractor._extract_with_flavor(handler, "lattice")
+
+        assert mock_score.call_count == 1
+        assert [table.metadata["quality_score"] for table in tables] == [None, 0.7]
+
+    def test_extract_table_at_region_passes_camelot_area(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that the region is passed to Camelot as left,top,right,bottom."""
+        bbox = BoundingBox(x0=72.0, y0=600.0, x1=432.0, y1=760.0, page=1)
+
+        with patch.object(
+            _SplitPDFHandler, "parse", return_value=[]
+        ) as mock_parse:
+            result = extractor.extract_table_at_region(sample_pdf_path, 1, bbox)
+
+        assert result is None
+        mock_parse.assert_called_once_with(
+            flavor="lattice",
+            pages=[2],
+            table_areas=["72.0,760.0,432.0,600.0"],
+        )
+
+    def test_extract_table_at_region_renders_without_ghostscript(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that lattice regions render through PyMuPDF without a handler."""
+        bbox = BoundingBox(x0=60.0, y0=90.0, x1=290.0, y1=210.0, page=0)
+
+        with patch.object(
+            _PyMuPDFBackend,
+            "convert",
+            autospec=True,
+            side_effect=_PyMuPDFBackend.convert,
+        ) as mock_convert:
+            extractor.extract_table_at_region(sample_pdf_path, 0, bbox)
+
+        assert mock_convert.call_count == 1
+
+    def test_extract_page_reuses_open_pdf(
+        self, extractor: TableExtractor, sample_pdf_path: Path
+    ) -> None:
+        """Test that per-page extraction parses the source PDF only once."""
+        with patch(
+            "src.parsers.table_extractor.PdfReader", wraps=PdfReader
+        ) as mock_reader, patch(
+            "src.parsers.table_extractor.fitz.open", wraps=fitz.open
+        ) as mock_fitz_open:
+            with extractor.open(sample_pdf_path) as handler:
+                first_page_tables = extractor.extract_page(handler, 0, flavor="both")
+                split_after_first = set(handler._split_pages)
+                extractor.extract_page(handler, 1, flavor="both")
+
+        source_opens = [
+            call for call in mock_fitz_open.call_args_list
+            if call.args[0] == str(sample_pdf_path)
+        ]
+        assert mock_reader.call_count == 1
+        assert len(source_opens) == 1
+        assert split_after_first == {1}  # Only the requested page is split
+        assert all(table.page == 0 for table in first_page_tables)
+
+    def test_split_handler_releases_plotting_data(
+        self, sample_pdf_path: Path
+    ) -> None:
+        """Test that per-table page images are released after each page."""
+        camelot_table = SimpleNamespace(
+            page=1, order=1, _image=object(), _segments=object(),
+            _text=[], _textedges=None,
+        )
+
+        with patch(
+            "src.parsers.table_extractor._SplitPDFHandler._save_page"
+        ), patch("src.parsers.table_extractor.Lattice") as mock_lattice, patch(
+            "src.parsers.table_extractor.TableList", side_effect=list
+        ):
+            mock_lattice.return_value.extract_tables.side_effect = [[camelot_table], []]
+
+            with _SplitPDFHandler(str(sample_pdf_path), pages="all") as handler:
+                tables = handler.parse(flavor="lattice")
+
+        assert tables == [camelot_table]
+        assert camelot_table._image is None
+        assert camelot_table._segments is None
+
+    def test_split_handler_reads_pdf_once(self, sample_pdf_path: Path) -> None:
+        """Test that splitting and page areas share a single PDF read."""
+        with patch(
+            "src.parsers.table_extractor.PdfReader", wraps=PdfReader
+        ) as mock_reader:
+            with _SplitPDFHandler(str(sample_pdf_path), pages="all") as handler:
+                handler._split()
+                page_files = sorted(os.listdir(handler._tempdir))
+                areas = [handler.page_area(page) for page in handler.pages]
+
+        assert mock_reader.call_count == 1
+        assert page_files == ["page-1.pdf", "page-2.pdf"]
+        assert areas == [595.0 * 842.0] * 2
+
+    def test_split_handler_resolves_page_specs(self, sample_pdf_path: Path) -> None:
+        """Test page specs, opening the PDF only when the page count is needed."""
+        with patch(
+            "src.parsers.table_extractor.PdfReader", wraps=PdfReader
+        ) as mock_reader:
+            explicit = _SplitPDFHandler(str(sample_pdf_path), pages="2,1-2").pages
+            assert mock_reader.call_count == 0
+
+            open_ended = _SplitPDFHandler(str(sample_pdf_path), pages="2-end").pages
+
+        assert explicit == [1, 2]
+        assert open_ended == [2]
+        assert mock_reader.call_count == 1
+
+    def test_pymupdf_backend_renders_page(
+        self, sample_pdf_path: Path, tmp_path: Path
+    ) -> None:
+        """Test that the lattice backend renders the page at 300 DPI."""
+        png_path = tmp_path / "page.png"
+
+        _PyMuPDFBackend().convert(str(sample_pdf_path), str(png_path))
+
+        pixmap = fitz.Pixmap(str(png_path))
+        assert (pixmap.width, pixmap.height) == (2480, 3509)  # 595x842pt at 300 DPI